@@ -19,7 +19,7 @@ High-Level Steps:
         1. Initialize a client with an existing operator account as the Owner.
 
     Required:
-        2. Create Spender and Receiver accounts.
+        2. Create Spender and Receiver accounts in a single atomic batch.
         3. Approve an HBAR allowance from the Owner to the Spender.
         4. Submit a transfer transaction that consumes the allowance, moving
            HBAR from the Owner to the Receiver.
@@ -29,14 +29,26 @@ Notes:
     not the Owner. This reflects the delegated spending model described in the
     Hedera allowance documentation. This example focuses solely on HBAR
     allowances and does not demonstrate revoking allowances or token/NFT usage.
+
+    The Spender and Receiver accounts are independent of each other, so both
+    AccountCreateTransactions are submitted as inner transactions of one
+    BatchTransaction (HIP-551). This costs a single consensus round-trip
+    instead of two; the new account IDs are read from the inner receipts,
+    which are queried concurrently.
 """
 
-import os
 import sys
 
 from dotenv import load_dotenv
 
-from hiero_sdk_python import AccountId, Client, Hbar, PrivateKey, TransactionId
+from hiero_sdk_python import (
+    AccountId,
+    BatchTransaction,
+    Client,
+    Hbar,
+    PrivateKey,
+    TransactionId,
+)
 from hiero_sdk_python.account.account_allowance_approve_transaction import (
     AccountAllowanceApproveTransaction,
 )
@@ -46,7 +58,6 @@ from hiero_sdk_python.transaction.transfer_transaction import TransferTransactio
 
 
 load_dotenv()
-network_name = os.getenv("NETWORK", "testnet").lower()
 
 
 def setup_client() -> Client:
@@ -57,26 +68,51 @@ def setup_client() -> Client:
     return client
 
 
-def create_account(client: Client):
-    """Create a new Hedera account with initial balance."""
+def build_account_create_transaction(client: Client, batch_key: PrivateKey):
+    """Build a batchified AccountCreateTransaction for a new account with initial balance."""
     account_private_key = PrivateKey.generate_ed25519()
     account_public_key = account_private_key.public_key()
 
-    account_receipt = (
+    transaction = (
         AccountCreateTransaction()
         .set_key_without_alias(account_public_key)
         .set_initial_balance(Hbar(1))
         .set_account_memo("Account for hbar allowance")
-        .execute(client)
+        .batchify(client, batch_key)
     )
 
-    if account_receipt.status != ResponseCode.SUCCESS:
-        print(f"Account creation failed with status: {ResponseCode(account_receipt.status).name}")
+    return transaction, account_private_key
+
+
+def create_accounts(client: Client, count: int):
+    """Create `count` new Hedera accounts in a single atomic batch transaction."""
+    # The operator pays for the batch, so its key doubles as the batch key
+    batch_key = client.operator_private_key
+
+    batch = BatchTransaction()
+    private_keys = []
+    for _ in range(count):
+        transaction, private_key = build_account_create_transaction(client, batch_key)
+        batch.add_inner_transaction(transaction)
+        private_keys.append(private_key)
+
+    batch_receipt = batch.freeze_with(client).sign(batch_key).execute(client)
+
+    if batch_receipt.status != ResponseCode.SUCCESS:
+        print(f"Account creation batch failed with status: {ResponseCode(batch_receipt.status).name}")
         sys.exit(1)
 
-    account_account_id = account_receipt.account_id
+    # Each inner transaction keeps its own receipt, which holds the new account ID.
+    # The receipts are fetched concurrently rather than one query after another.
+    accounts = []
+    for account_receipt, private_key in zip(batch.get_inner_receipts(client), private_keys, strict=True):
+        if account_receipt.status != ResponseCode.SUCCESS:
+            print(f"Account creation failed with status: {ResponseCode(account_receipt.status).name}")
+            sys.exit(1)
+
+        accounts.append((account_receipt.account_id, private_key))
 
-    return account_account_id, account_private_key
+    return accounts
 
 
 def approve_hbar_allowance(
@@ -109,12 +145,13 @@ def transfer_hbar_with_allowance(
     amount: Hbar,
 ):
     """Transfer hbars using a previously approved allowance."""
+    tinybars = amount.to_tinybars()
+
     receipt = (
         TransferTransaction()
         # Transaction is paid for / initiated by spender
         .set_transaction_id(TransactionId.generate(spender_account_id))
-        .add_approved_hbar_transfer(owner_account_id, -amount.to_tinybars())
-        .add_approved_hbar_transfer(receiver_account_id, amount.to_tinybars())
+        .add_approved_hbar_transfers({owner_account_id: -tinybars, receiver_account_id: tinybars})
         .freeze_with(client)
         .sign(spender_private_key)
         .execute(client)
@@ -134,17 +171,15 @@ def main():
     Demonstrates hbar allowance functionality by:
 
     1. Setting up client with operator account
-    2. Creating spender and receiver accounts
+    2. Creating spender and receiver accounts in one batch
     3. Approving hbar allowance for spender
     4. Transferring hbars using the allowance.
     """
     client = setup_client()
 
     # Create spender and receiver accounts
-    spender_id, spender_private_key = create_account(client)
+    (spender_id, spender_private_key), (receiver_id, _) = create_accounts(client, 2)
     print(f"Spender account created with ID: {spender_id}")
-
-    receiver_id, _ = create_account(client)
     print(f"Receiver account created with ID: {receiver_id}")
 
     # Approve hbar allowance for spender
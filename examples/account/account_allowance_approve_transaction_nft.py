@@ -19,24 +19,25 @@ High-Level Steps:
         2. Create and mint an NFT to the Owner.
 
     Required:
-        3. Approve the Spender to transfer the Owner's NFT.
+        3. Associate the NFT with the Receiver account and approve the Spender
+           to transfer the Owner's NFT, both in a single atomic batch.
 
     Demonstration:
-        4. Associate the NFT with the Receiver account.
-        5. Transfer the NFT using the approved allowance.
+        4. Transfer the NFT using the approved allowance.
 
 Usage:
     uv run examples/account/account_allowance_approve_transaction_nft.py
 """
 
-import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 from dotenv import load_dotenv
 
 from hiero_sdk_python import (
     AccountAllowanceApproveTransaction,
     AccountId,
+    BatchTransaction,
     Client,
     Hbar,
     NftId,
@@ -54,7 +55,7 @@ from hiero_sdk_python.account.account_create_transaction import AccountCreateTra
 
 load_dotenv()
 
-network_name = os.getenv("NETWORK", "testnet").lower()
+NFTS_PER_MINT = 10
 
 
 def setup_client() -> tuple[Client, AccountId, PrivateKey]:
@@ -92,8 +93,8 @@ def create_account(client, memo="Test Account"):
     return account_id, private_key
 
 
-def create_nft_token(client, owner_id, owner_key):
-    """Create a new non-fungible token (NFT) with the owner as treasury."""
+def submit_nft_token_creation(client, owner_id, owner_key):
+    """Submit a new non-fungible token (NFT) with the owner as treasury, without waiting for the receipt."""
     tx = (
         TokenCreateTransaction()
         .set_token_name("ApproveTest NFT")
@@ -109,7 +110,12 @@ def create_nft_token(client, owner_id, owner_key):
         .sign(owner_key)
     )
 
-    receipt = tx.execute(client)
+    return tx.execute(client, wait_for_receipt=False)
+
+
+def get_created_nft_token_id(client, owner_id, response):
+    """Wait for the token creation receipt and return the new token ID."""
+    receipt = response.get_receipt(client)
 
     if receipt.status != ResponseCode.SUCCESS:
         print(f"Token creation failed: {ResponseCode(receipt.status).name}")
@@ -132,38 +138,49 @@ def mint_nft(client, token_id, metadata_list):
     return [NftId(token_id, s) for s in serials]
 
 
-def associate_token_with_account(client, account_id, private_key, token_id):
-    """Associate a token with an account."""
-    tx = (
+def build_associate_transaction(client, account_id, private_key, token_id, batch_key):
+    """Build a batchified transaction associating a token with an account."""
+    return (
         TokenAssociateTransaction()
         .set_account_id(account_id)
         .add_token_id(token_id)
-        .freeze_with(client)
+        .batchify(client, batch_key)
         .sign(private_key)
-        .execute(client)
     )
 
-    if tx.status != ResponseCode.SUCCESS:
-        print(f"Association failed: {ResponseCode(tx.status).name}")
-        sys.exit(1)
-
-    print(f"Associated token {token_id} with Receiver account {account_id}")
-
 
-def approve_nft_allowance(client, nft_id, owner_id, spender_id, owner_key):
-    """Approve NFT allowance for a spender."""
-    tx = (
+def build_approve_nft_allowance_transaction(client, nft_id, owner_id, spender_id, owner_key, batch_key):
+    """Build a batchified transaction approving an NFT allowance for a spender."""
+    return (
         AccountAllowanceApproveTransaction()
         .approve_token_nft_allowance_all_serials(nft_id.token_id, owner_id, spender_id)
-        .freeze_with(client)
+        .batchify(client, batch_key)
         .sign(owner_key)
+    )
+
+
+def associate_and_approve_nft_allowance(client, nft_id, owner_id, owner_key, spender_id, receiver_id, receiver_key):
+    """Associate the token with the receiver and approve the spender in one batch transaction."""
+    # The owner pays for the batch, so its key doubles as the batch key
+    batch_key = owner_key
+
+    associate_tx = build_associate_transaction(client, receiver_id, receiver_key, nft_id.token_id, batch_key)
+    approve_tx = build_approve_nft_allowance_transaction(client, nft_id, owner_id, spender_id, owner_key, batch_key)
+
+    receipt = (
+        BatchTransaction()
+        .add_inner_transaction(associate_tx)
+        .add_inner_transaction(approve_tx)
+        .freeze_with(client)
+        .sign(batch_key)
         .execute(client)
     )
 
-    if tx.status != ResponseCode.SUCCESS:
-        print(f"Approval failed: {ResponseCode(tx.status).name}")
+    if receipt.status != ResponseCode.SUCCESS:
+        print(f"Association and approval batch failed: {ResponseCode(receipt.status).name}")
         sys.exit(1)
 
+    print(f"Associated token {nft_id.token_id} with Receiver account {receiver_id}")
     print(f"NFT Owner ({owner_id}) approved Spender ({spender_id}) for NFT {nft_id.token_id} (all serials)")
 
 
@@ -187,25 +204,31 @@ def main():
     owner_client, owner_id, owner_key = setup_client()
 
     try:
-        # Create spender and receiver accounts
-        spender_id, spender_key = create_account(owner_client, "Spender")
-        receiver_id, receiver_key = create_account(owner_client, "Receiver")
+        # Submit the NFT token first; it reaches consensus while the accounts are being created
+        token_response = submit_nft_token_creation(owner_client, owner_id, owner_key)
 
-        # Create and mint NFT
-        token_id = create_nft_token(owner_client, owner_id, owner_key)
-        nft_ids = mint_nft(owner_client, token_id, [b"Metadata 1"])
-        nft_id = nft_ids[0]
+        # Create spender and receiver accounts concurrently, they do not depend on each other
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            spender_future = executor.submit(create_account, owner_client, "Spender")
+            receiver_future = executor.submit(create_account, owner_client, "Receiver")
 
-        # Associate token with receiver
-        associate_token_with_account(owner_client, receiver_id, receiver_key, token_id)
+            spender_id, spender_key = spender_future.result()
+            receiver_id, receiver_key = receiver_future.result()
+
+        # Collect the NFT token and mint
+        token_id = get_created_nft_token_id(owner_client, owner_id, token_response)
+        # A single TokenMintTransaction mints up to 10 NFTs in one consensus round
+        nft_ids = mint_nft(owner_client, token_id, [b"Metadata %d" % i for i in range(1, NFTS_PER_MINT + 1)])
+        nft_id = nft_ids[0]
 
-        # Approve allowance
-        approve_nft_allowance(owner_client, nft_id, owner_id, spender_id, owner_key)
+        # Associate token with receiver and approve allowance in a single batch
+        associate_and_approve_nft_allowance(
+            owner_client, nft_id, owner_id, owner_key, spender_id, receiver_id, receiver_key
+        )
 
         # Create a client for the spender
         print("\nSetting up client for the Spender...")
-        spender_client = Client(owner_client.network)
-        spender_client.set_operator(spender_id, spender_key)
+        spender_client = owner_client.with_operator(spender_id, spender_key)
         print(f"Client setup for Spender: {spender_id}")
 
         # Transfer NFT using the allowance
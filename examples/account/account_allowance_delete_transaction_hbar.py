@@ -1,6 +1,5 @@
 """Example demonstrating hbar allowance approval, deletion, and failure after deletion."""
 
-import os
 import sys
 
 from dotenv import load_dotenv
@@ -15,7 +14,6 @@ from hiero_sdk_python.transaction.transfer_transaction import TransferTransactio
 
 
 load_dotenv()
-network_name = os.getenv("NETWORK", "testnet").lower()
 
 
 def setup_client() -> Client:
@@ -5,8 +5,8 @@ this example demonstrates deleting an NFT allowance.
 
 - Creates an owner and spender account.
 - Creates and mints an NFT.
-- Approves the spender.
-- Deletes the allowance.
+- Approves the spender and deletes the allowance again, both in one
+  BatchTransaction (HIP-551) so they share a single consensus round.
 - Verifies the spender can NO LONGER transfer the NFT.
 
 Usage:
@@ -14,14 +14,15 @@ Usage:
     uv run examples/account/account_allowance_delete_transaction_nft.py
 """
 
-import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 from dotenv import load_dotenv
 
 from hiero_sdk_python import (
     AccountAllowanceApproveTransaction,
     AccountId,
+    BatchTransaction,
     Client,
     Hbar,
     NftId,
@@ -39,7 +40,8 @@ from hiero_sdk_python.account.account_create_transaction import AccountCreateTra
 
 
 load_dotenv()
-network_name = os.getenv("NETWORK", "testnet").lower()
+
+NFTS_PER_MINT = 10
 
 
 def setup_client() -> tuple[Client, AccountId, PrivateKey]:
@@ -154,61 +156,81 @@ def associate_token_with_account(client, account_id, private_key, token_id):
         sys.exit(1)
 
 
-def approve_nft_allowance_all_serials(
+def build_approve_nft_allowance_all_serials_transaction(
     client,
     token_id: TokenId,
     owner_id: AccountId,
     spender_id: AccountId,
     owner_key: PrivateKey,
 ):
-    """Approve NFT allowance for ALL serials for a spender."""
-    try:
-        tx = (
-            AccountAllowanceApproveTransaction()
-            .approve_token_nft_allowance_all_serials(token_id, owner_id, spender_id)
-            .freeze_with(client)
-            .sign(owner_key)
-            .execute(client)
-        )
+    """Build a batchified transaction approving an NFT allowance for ALL serials for a spender."""
+    return (
+        AccountAllowanceApproveTransaction()
+        .approve_token_nft_allowance_all_serials(token_id, owner_id, spender_id)
+        .batchify(client, owner_key)
+        .sign(owner_key)
+    )
 
-        receipt = tx
-        if receipt.status != ResponseCode.SUCCESS:
-            print(f"Allowance approval failed: {ResponseCode(receipt.status).name}")
-            sys.exit(1)
 
-        print(f"NFT Owner ({owner_id}) approved Spender ({spender_id}) for ALL serials of token {token_id}")
-    except Exception as e:
-        print(f"Allowance approval exception: {e}")
-        sys.exit(1)
+def build_delete_nft_allowance_all_serials_transaction(
+    client,
+    token_id: TokenId,
+    owner_id: AccountId,
+    spender_id: AccountId,
+    owner_key: PrivateKey,
+):
+    """Build a batchified transaction revoking an "approve for all serials" NFT allowance from a spender."""
+    return (
+        AccountAllowanceApproveTransaction()
+        .delete_token_nft_allowance_all_serials(token_id, owner_id, spender_id)
+        .batchify(client, owner_key)
+        .sign(owner_key)
+    )
 
 
-def delete_nft_allowance_all_serials(
+def approve_and_delete_nft_allowance_all_serials(
     client,
     token_id: TokenId,
     owner_id: AccountId,
     spender_id: AccountId,
     owner_key: PrivateKey,
 ):
-    """Revokes an "approve for all serials" NFT allowance from a spender."""
-    print(f"NFT Owner ({owner_id}) deleting 'approve for all' allowance for {token_id} from Spender ({spender_id})...")
+    """
+    Approve and then delete an NFT allowance for ALL serials in one batch transaction.
+
+    Both inner transactions are signed by the owner, whose key also serves as the batch key.
+    The batch executes them in order and atomically, in a single consensus round.
+    """
+    print(
+        f"NFT Owner ({owner_id}) approving and deleting 'approve for all' allowance for {token_id} "
+        f"for Spender ({spender_id})..."
+    )
 
     try:
-        tx = (
-            AccountAllowanceApproveTransaction()
-            .delete_token_nft_allowance_all_serials(token_id, owner_id, spender_id)
+        approve_tx = build_approve_nft_allowance_all_serials_transaction(
+            client, token_id, owner_id, spender_id, owner_key
+        )
+        delete_tx = build_delete_nft_allowance_all_serials_transaction(
+            client, token_id, owner_id, spender_id, owner_key
+        )
+
+        receipt = (
+            BatchTransaction()
+            .add_inner_transaction(approve_tx)
+            .add_inner_transaction(delete_tx)
             .freeze_with(client)
             .sign(owner_key)
             .execute(client)
         )
 
-        receipt = tx
         if receipt.status != ResponseCode.SUCCESS:
-            print(f"Allowance deletion failed: {ResponseCode(receipt.status).name}")
+            print(f"Allowance approval and deletion batch failed: {ResponseCode(receipt.status).name}")
             sys.exit(1)
 
+        print(f"NFT Owner ({owner_id}) approved Spender ({spender_id}) for ALL serials of token {token_id}")
         print("Allowance successfully deleted.")
     except Exception as e:
-        print(f"Allowance deletion exception: {e}")
+        print(f"Allowance approval and deletion exception: {e}")
         sys.exit(1)
 
 
@@ -249,22 +271,25 @@ def main():
 
         # 2. Create and mint NFT
         token_id = create_nft_token(owner_client, owner_id, owner_key)
-        nft_ids = mint_nft(owner_client, token_id, [b"Metadata 1"])
+        # A single TokenMintTransaction mints up to 10 NFTs in one consensus round
+        nft_ids = mint_nft(owner_client, token_id, [b"Metadata %d" % i for i in range(1, NFTS_PER_MINT + 1)])
         nft_id = nft_ids[0]  # The specific NFT we will try to transfer
 
-        # 3. Associate receiver
-        associate_token_with_account(owner_client, receiver_id, receiver_key, token_id)
-
-        # 4. Approve allowance (for all serials)
-        approve_nft_allowance_all_serials(owner_client, token_id, owner_id, spender_id, owner_key)
-
-        # 5. Delete the "all serials" allowance
-        delete_nft_allowance_all_serials(owner_client, token_id, owner_id, spender_id, owner_key)
+        # 3. Associate receiver, while 4. approving and 5. deleting the "all serials" allowance in one batch.
+        # They touch different accounts, so both are submitted at once and reach consensus together.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            association = executor.submit(
+                associate_token_with_account, owner_client, receiver_id, receiver_key, token_id
+            )
+            allowance = executor.submit(
+                approve_and_delete_nft_allowance_all_serials, owner_client, token_id, owner_id, spender_id, owner_key
+            )
+            association.result()
+            allowance.result()
 
         # 6. Verify deletion
         print("\nSetting up client for the Spender...")
-        spender_client = Client(owner_client.network)
-        spender_client.set_operator(spender_id, spender_key)
+        spender_client = owner_client.with_operator(spender_id, spender_key)
         print(f"Client setup for Spender: {spender_id}")
 
         # We try to transfer the specific serial (nft_id)
@@ -0,0 +1,84 @@
+"""
+Concurrent Account Creation Example.
+
+This module demonstrates how to create several Hedera accounts at once using
+execute_async(). Each creation is independent, so the transactions are awaited
+together with asyncio.gather() and their network round-trips (submission and
+receipt polling) overlap instead of running one after another.
+
+Usage:
+    Run this script directly:
+        python examples/account/account_create_transaction_async.py
+
+    Or using uv:
+        uv run examples/account/account_create_transaction_async.py
+
+Requirements:
+    - Environment variables OPERATOR_ID and OPERATOR_KEY must be set
+    - A .env file with the operator credentials (recommended)
+    - Sufficient HBAR balance in the operator account to pay for account creation
+
+Environment Variables:
+    OPERATOR_ID (str): The account ID of the operator (format: "0.0.xxxxx")
+    OPERATOR_KEY (str): The private key of the operator account
+    NETWORK (str, optional): Network to use (default: "testnet")
+"""
+
+import asyncio
+import sys
+
+from hiero_sdk_python import (
+    AccountCreateTransaction,
+    Client,
+    Hbar,
+    PrivateKey,
+    ResponseCode,
+)
+
+
+ACCOUNTS_TO_CREATE = 3
+
+
+async def create_account(client: Client, index: int):
+    """Create one account with a freshly generated Ed25519 key and return its ID."""
+    account_private_key = PrivateKey.generate_ed25519()
+
+    transaction = (
+        AccountCreateTransaction()
+        .set_key_without_alias(account_private_key.public_key())
+        .set_initial_balance(Hbar(1))
+        .set_account_memo(f"Concurrent account {index}")
+    )
+
+    receipt = await transaction.execute_async(client)
+
+    if receipt.status != ResponseCode.SUCCESS:
+        raise RuntimeError(f"Account {index} creation failed with status: {ResponseCode(receipt.status).name}")
+
+    return receipt.account_id
+
+
+async def create_accounts_concurrently():
+    """
+    Demonstrates concurrent account creation by:
+
+    1. Setting up client with operator account
+    2. Submitting several independent account creations at once
+    3. Printing the resulting account IDs.
+    """
+    client = Client.from_env()
+
+    try:
+        account_ids = await asyncio.gather(*(create_account(client, i) for i in range(1, ACCOUNTS_TO_CREATE + 1)))
+    except Exception as error:
+        print(f"❌ Error: {error}")
+        sys.exit(1)
+    finally:
+        client.close()
+
+    for account_id in account_ids:
+        print(f"✅ Account created with ID: {account_id}")
+
+
+if __name__ == "__main__":
+    asyncio.run(create_accounts_concurrently())
@@ -44,10 +44,11 @@ def auto_create_account(client, evm_address):
     try:
         evm_account_id = AccountId.from_evm_address(evm_address, 0, 0)
 
+        amount_tinybars = Hbar(1).to_tinybars()
         transfer_tx = (
             TransferTransaction()
-            .add_hbar_transfer(evm_account_id, Hbar(1).to_tinybars())
-            .add_hbar_transfer(client.operator_account_id, Hbar(-1).to_tinybars())
+            .add_hbar_transfer(evm_account_id, amount_tinybars)
+            .add_hbar_transfer(client.operator_account_id, -amount_tinybars)
             .execute(client)
         )
 
@@ -7,11 +7,8 @@ uv run examples/account/account_records_query.py
 python examples/account/account_records_query.py
 """
 
-import os
 import sys
 
-from dotenv import load_dotenv
-
 from hiero_sdk_python import (
     AccountCreateTransaction,
     Client,
@@ -23,9 +20,9 @@ from hiero_sdk_python.account.account_records_query import AccountRecordsQuery
 from hiero_sdk_python.transaction.transfer_transaction import TransferTransaction
 
 
-load_dotenv()
-
-network_name = os.getenv("NETWORK", "testnet").lower()
+TRANSFER_AMOUNT_TINYBARS = Hbar(1).to_tinybars()
+RECORDS_BORDER = "=" * 80
+RECORD_SEPARATOR = "-" * 80
 
 
 def setup_client() -> Client:
@@ -60,41 +57,45 @@ def create_account(client):
     return account_id, account_private_key
 
 
-def format_single_record(record, idx):
-    """Format a single account record."""
-    lines = []
-    lines.append(f"\nRecord #{idx}")
-    lines.append("-" * 80)
-
-    transaction_id = getattr(record, "transaction_id", None)
-    if transaction_id:
-        lines.append(f"  Transaction ID: {transaction_id}")
-
-    consensus_timestamp = getattr(record, "consensus_timestamp", None)
-    if consensus_timestamp:
-        lines.append(f"  Consensus Timestamp: {consensus_timestamp}")
+def format_tinybar_as_hbar(amount_in_tinybar):
+    """Format a tinybar amount as a signed hbar string with 8 decimals, using exact integer arithmetic."""
+    sign = "-" if amount_in_tinybar < 0 else "+"
+    hbars, tinybars = divmod(abs(amount_in_tinybar), 100_000_000)
+    return f"{sign}{hbars}.{tinybars:08d}"
 
-    transaction_fee = getattr(record, "transaction_fee", None)
-    if transaction_fee:
-        lines.append(f"  Transaction Fee: {transaction_fee} tinybar")
 
-    transaction_hash = getattr(record, "transaction_hash", None)
-    if transaction_hash:
-        lines.append(f"  Transaction Hash: {transaction_hash.hex()}")
-
-    receipt = getattr(record, "receipt", None)
-    if receipt:
-        lines.append(f"  Receipt Status: {ResponseCode(receipt.status).name}")
+def format_single_record(record, idx):
+    """Format a single account record."""
+    transaction_fee = record.transaction_fee
+    transaction_hash = record.transaction_hash
+    receipt = record.receipt
+    transfers = record.transfers
+
+    # (label, formatted value) pairs; fields that are not set are skipped
+    fields = (
+        ("Transaction ID", record.transaction_id),
+        ("Consensus Timestamp", record.consensus_timestamp),
+        ("Transaction Fee", transaction_fee and f"{transaction_fee} tinybar"),
+        ("Transaction Hash", transaction_hash and transaction_hash.hex()),
+        ("Receipt Status", receipt and ResponseCode(receipt.status).name),
+    )
 
-    transfers = getattr(record, "transfers", None)
+    transfer_lines = ()
     if transfers:
-        lines.append("  Transfers:")
-        for account_id, amount_in_tinybar in transfers.items():
-            amount_hbar = amount_in_tinybar / 100_000_000  # Convert tinybar to hbar
-            lines.append(f"    {account_id}: {amount_hbar:+.8f} ℏ")
-
-    lines.append("-" * 80)
-    return "\n".join(lines)
+        transfer_lines = (
+            "  Transfers:",
+            *(f"    {account_id}: {format_tinybar_as_hbar(amount)} ℏ" for account_id, amount in transfers.items()),
+        )
+
+    return "\n".join(
+        (
+            f"\nRecord #{idx}",
+            RECORD_SEPARATOR,
+            *(f"  {label}: {value}" for label, value in fields if value),
+            *transfer_lines,
+            RECORD_SEPARATOR,
+        )
+    )
 
 
 def format_account_records(records):
@@ -102,13 +103,28 @@ def format_account_records(records):
     if not records:
         return "No records found"
 
-    output = ["=" * 80]
+    return "\n".join(
+        (
+            RECORDS_BORDER,
+            *(format_single_record(record, idx) for idx, record in enumerate(records, 1)),
+            RECORDS_BORDER,
+        )
+    )
+
 
-    for idx, record in enumerate(records, 1):
-        output.append(format_single_record(record, idx))
+def transfer_to_operator(client, account_id, original_operator_id):
+    """Transfer 1 ℏ from the new account (the client's operator) back to the original operator."""
+    print(f"\nTransferring 1 ℏ from {account_id} to {original_operator_id}...")
+    receipt = (
+        TransferTransaction()
+        .add_hbar_transfer(account_id, -TRANSFER_AMOUNT_TINYBARS)
+        .add_hbar_transfer(original_operator_id, TRANSFER_AMOUNT_TINYBARS)
+        .execute(client)
+    )
 
-    output.append("=" * 80)
-    return "\n".join(output)
+    if receipt.status != ResponseCode.SUCCESS:
+        print(f"Transfer failed with status: {ResponseCode(receipt.status).name}")
+        sys.exit(1)
 
 
 def query_account_records():
@@ -116,9 +132,9 @@ def query_account_records():
     Demonstrates the account record query functionality by:
 
     1. Setting up client with operator account
-    2. Creating a new account and setting it as the operator
+    2. Creating a new account
     3. Querying account records and displaying basic information
-    4. Performing a transfer transaction
+    4. Performing a transfer transaction with the new account as the operator
     5. Querying account records again to see updated transaction history.
     """
     client = setup_client()
@@ -135,21 +151,9 @@ def query_account_records():
     print("\nTransaction records (before transfer):")
     print(format_account_records(records_before))
 
-    # Set the newly created account as the operator for executing the transfer
-    client.set_operator(account_id, account_private_key)
-
-    # Perform a transfer transaction from the newly created account to the original operator
-    print(f"\nTransferring 1 ℏ from {account_id} to {original_operator_id}...")
-    receipt = (
-        TransferTransaction()
-        .add_hbar_transfer(account_id, -Hbar(1).to_tinybars())
-        .add_hbar_transfer(original_operator_id, Hbar(1).to_tinybars())
-        .execute(client)
-    )
-
-    if receipt.status != ResponseCode.SUCCESS:
-        print(f"Transfer failed with status: {ResponseCode(receipt.status).name}")
-        sys.exit(1)
+    # Use the newly created account as the operator for executing the transfer
+    account_client = client.with_operator(account_id, account_private_key)
+    transfer_to_operator(account_client, account_id, original_operator_id)
 
     records_after = AccountRecordsQuery().set_account_id(account_id).execute(client)
 
@@ -35,10 +35,11 @@ def setup_network():
     return network
 
 
-def setup_client() -> Client:
-    """Setup Client."""
-    client = Client.from_env()
-    print(f"Network: {client.network.network}")
+def setup_client(network: Network) -> Client:
+    """Create the client on top of the already configured network."""
+    print("\nStep 2: Create the client")
+    client = Client(network)
+    print(f"  - Client created for network: {client.network.network}")
     return client
 
 
@@ -86,8 +87,8 @@ def display_available_nodes(client):
 def demonstrate_manual_setup():
     """Run the detailed, step-by-step setup."""
     print("\n--- [ Method 1: Manual Setup] ---")
-    setup_network()
-    client = setup_client()
+    network = setup_network()
+    client = setup_client(network)
     setup_operator(client)
     display_client_configuration(client)
     display_available_nodes(client)
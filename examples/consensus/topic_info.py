@@ -31,29 +31,35 @@ from hiero_sdk_python.consensus.topic_id import TopicId
 from hiero_sdk_python.consensus.topic_info import TopicInfo
 from hiero_sdk_python.crypto.private_key import PrivateKey
 from hiero_sdk_python.Duration import Duration
-from hiero_sdk_python.hapi.services import consensus_get_topic_info_pb2, consensus_topic_info_pb2
+from hiero_sdk_python.hapi.services import consensus_get_topic_info_pb2
 from hiero_sdk_python.hapi.services.basic_types_pb2 import AccountID, Key
 from hiero_sdk_python.hapi.services.timestamp_pb2 import Timestamp
 from hiero_sdk_python.tokens.custom_fixed_fee import CustomFixedFee
 
 
+MOCK_RUNNING_HASH = b"\x00" * 48
+MOCK_LEDGER_ID = b"\x01"
+
+
 def mock_running_hash() -> bytes:
     """Generate a mock 48-byte running hash."""
-    return bytes.fromhex("00" * 48)
+    return MOCK_RUNNING_HASH
 
 
-def mock_admin_key() -> Key:
-    """Create a mock admin key."""
+def mock_admin_key(key: Key | None = None) -> Key:
+    """Create a mock admin key, or fill in the given Key message in place."""
     public_key = PrivateKey.generate_ed25519().public_key()
-    key = Key()
+    if key is None:
+        key = Key()
     key.ed25519 = public_key.to_bytes_raw()
     return key
 
 
-def mock_submit_key() -> Key:
-    """Create a mock submit key."""
+def mock_submit_key(key: Key | None = None) -> Key:
+    """Create a mock submit key, or fill in the given Key message in place."""
     public_key = PrivateKey.generate_ecdsa().public_key()
-    key = Key()
+    if key is None:
+        key = Key()
     key.ECDSA_secp256k1 = public_key.to_bytes_raw()
     return key
 
@@ -68,17 +74,19 @@ def mock_custom_fee() -> CustomFixedFee:
     )
 
 
-def mock_expiration_time() -> Timestamp:
-    """Create a mock expiration timestamp."""
-    timestamp = Timestamp()
+def mock_expiration_time(timestamp: Timestamp | None = None) -> Timestamp:
+    """Create a mock expiration timestamp, or fill in the given Timestamp message in place."""
+    if timestamp is None:
+        timestamp = Timestamp()
     timestamp.seconds = 1767225600
     timestamp.nanos = 0
     return timestamp
 
 
-def mock_auto_renew_account() -> AccountID:
-    """Create a mock auto-renew account ID."""
-    account_id = AccountID()
+def mock_auto_renew_account(account_id: AccountID | None = None) -> AccountID:
+    """Create a mock auto-renew account ID, or fill in the given AccountID message in place."""
+    if account_id is None:
+        account_id = AccountID()
     account_id.shardNum = 0
     account_id.realmNum = 0
     account_id.accountNum = 100
@@ -87,7 +95,7 @@ def mock_auto_renew_account() -> AccountID:
 
 def mock_ledger_id() -> bytes:
     """Create a mock ledger ID."""
-    return bytes.fromhex("01")
+    return MOCK_LEDGER_ID
 
 
 def build_mock_topic_info() -> TopicInfo:
@@ -114,20 +122,19 @@ def build_topic_info_from_proto() -> TopicInfo:
     proto = consensus_get_topic_info_pb2.ConsensusGetTopicInfoResponse()
     proto.topicID.CopyFrom(TopicId.from_string("0.0.101")._to_proto())
 
-    topic_info_proto = consensus_topic_info_pb2.ConsensusTopicInfo()
+    # Fill the nested messages in place instead of building them separately and copying them in
+    topic_info_proto = proto.topicInfo
     topic_info_proto.memo = "Topic from protobuf"
     topic_info_proto.runningHash = mock_running_hash()
     topic_info_proto.sequenceNumber = 100
-    topic_info_proto.expirationTime.CopyFrom(mock_expiration_time())
-    topic_info_proto.adminKey.CopyFrom(mock_admin_key())
-    topic_info_proto.submitKey.CopyFrom(mock_submit_key())
+    mock_expiration_time(topic_info_proto.expirationTime)
+    mock_admin_key(topic_info_proto.adminKey)
+    mock_submit_key(topic_info_proto.submitKey)
     topic_info_proto.autoRenewPeriod.seconds = 7776000
-    topic_info_proto.autoRenewAccount.CopyFrom(mock_auto_renew_account())
+    mock_auto_renew_account(topic_info_proto.autoRenewAccount)
     topic_info_proto.ledger_id = mock_ledger_id()
     topic_info_proto.custom_fees.append(mock_custom_fee()._to_topic_fee_proto())
 
-    proto.topicInfo.CopyFrom(topic_info_proto)
-
     return TopicInfo._from_proto(proto)
 
 
@@ -20,6 +20,8 @@ from hiero_sdk_python.consensus.topic_message import TopicMessage
 class MockTimestamp:
     """Mocks the protobuf Timestamp object."""
 
+    __slots__ = ("seconds", "nanos")
+
     def __init__(self, seconds: int, nanos: int = 0):
         self.seconds = seconds
         self.nanos = nanos
@@ -28,6 +30,8 @@ class MockTimestamp:
 class MockAccountID:
     """Mocks the protobuf AccountID object."""
 
+    __slots__ = ("shardNum", "realmNum", "accountNum", "alias")
+
     def __init__(self, shard, realm, num):
         self.shardNum = shard
         self.realmNum = realm
@@ -38,6 +42,8 @@ class MockAccountID:
 class MockTransactionID:
     """Mocks the protobuf TransactionID object."""
 
+    __slots__ = ("accountID", "transactionValidStart", "scheduled")
+
     def __init__(self, account_id, seconds, nanos):
 
         self.accountID = account_id
@@ -48,6 +54,8 @@ class MockTransactionID:
 class MockChunkInfo:
     """Mocks the protobuf ChunkInfo object."""
 
+    __slots__ = ("number", "total", "initialTransactionID")
+
     def __init__(self, seq: int, total_chunks: int, tx_id: MockTransactionID = None):
         self.number = seq
         self.total = total_chunks
@@ -55,14 +63,14 @@ class MockChunkInfo:
 
     def HasField(self, field_name: str) -> bool:
         """Simulates the protobuf HasField method."""
-        if field_name == "initialTransactionID":
-            return self.initialTransactionID is not None
-        return False
+        return field_name == "initialTransactionID" and self.initialTransactionID is not None
 
 
 class MockResponse:
     """Mocks the protobuf ConsensusTopicResponse object."""
 
+    __slots__ = ("message", "runningHash", "sequenceNumber", "consensusTimestamp", "chunkInfo")
+
     def __init__(
         self,
         message: bytes,
@@ -71,16 +79,18 @@ class MockResponse:
         chunk_info: MockChunkInfo = None,
     ):
         self.message = message
-        self.runningHash = b"mock_running_hash_" + str(seq).encode()
+        self.runningHash = b"mock_running_hash_%d" % seq
         self.sequenceNumber = seq
         self.consensusTimestamp = timestamp
         self.chunkInfo = chunk_info
 
     def HasField(self, field_name: str) -> bool:
         """Simulates the protobuf HasField method."""
-        if field_name == "chunkInfo":
-            return self.chunkInfo is not None
-        return False
+        return field_name == "chunkInfo" and self.chunkInfo is not None
+
+
+# Every chunk of a message carries the same initial transaction ID, so one instance is shared
+CHUNK_TRANSACTION_ID = MockTransactionID(MockAccountID(0, 0, 10), 1736539100, 1)
 
 
 def mock_consensus_response(
@@ -99,8 +109,7 @@ def mock_consensus_response(
 
     chunk_info = None
     if is_chunked:
-        tx_id = MockTransactionID(MockAccountID(0, 0, 10), 1736539100, 1) if has_tx_id else None
-        chunk_info = MockChunkInfo(seq, total_chunks, tx_id)
+        chunk_info = MockChunkInfo(seq, total_chunks, CHUNK_TRANSACTION_ID if has_tx_id else None)
 
     return MockResponse(message, seq, timestamp, chunk_info)
 
@@ -6,11 +6,8 @@ uv run examples/consensus/topic_update_transaction.py
 python examples/consensus/topic_update_transaction.py
 """
 
-import os
 import sys
 
-from dotenv import load_dotenv
-
 from hiero_sdk_python import (
     AccountId,
     Client,
@@ -21,10 +18,6 @@ from hiero_sdk_python import (
 )
 
 
-load_dotenv()
-network_name = os.getenv("NETWORK", "testnet").lower()
-
-
 def setup_client() -> tuple[Client, AccountId, PrivateKey]:
     """Setup Client."""
     client = Client.from_env()
@@ -19,11 +19,8 @@ Usage:
 
 """
 
-import os
 import sys
 
-from dotenv import load_dotenv
-
 from hiero_sdk_python import Client
 from hiero_sdk_python.contract.contract_call_query import ContractCallQuery
 from hiero_sdk_python.contract.contract_create_transaction import (
@@ -40,11 +37,6 @@ from hiero_sdk_python.response_code import ResponseCode
 from .contracts import STATEFUL_CONTRACT_BYTECODE
 
 
-load_dotenv()
-
-network_name = os.getenv("NETWORK", "testnet").lower()
-
-
 def setup_client() -> Client:
     """Setup Client."""
     client = Client.from_env()
@@ -17,11 +17,8 @@ Usage:
 
 """
 
-import os
 import sys
 
-from dotenv import load_dotenv
-
 from hiero_sdk_python import Client
 from hiero_sdk_python.contract.contract_create_transaction import (
     ContractCreateTransaction,
@@ -33,11 +30,6 @@ from hiero_sdk_python.response_code import ResponseCode
 from .contracts import SIMPLE_CONTRACT_BYTECODE
 
 
-load_dotenv()
-
-network_name = os.getenv("NETWORK", "testnet").lower()
-
-
 def setup_client() -> Client:
     """Setup Client."""
     client = Client.from_env()
@@ -17,11 +17,8 @@ Usage:
     python -m examples.contract.contract_create_transaction_with_constructor_parameters
 """
 
-import os
 import sys
 
-from dotenv import load_dotenv
-
 from hiero_sdk_python import Client
 from hiero_sdk_python.contract.contract_create_transaction import (
     ContractCreateTransaction,
@@ -34,11 +31,6 @@ from hiero_sdk_python.response_code import ResponseCode
 from .contracts import SIMPLE_CONTRACT_BYTECODE
 
 
-load_dotenv()
-
-network_name = os.getenv("NETWORK", "testnet").lower()
-
-
 def setup_client() -> Client:
     """Setup Client."""
     client = Client.from_env()
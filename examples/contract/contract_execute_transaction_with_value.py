@@ -42,11 +42,8 @@ Note:
     - A setMessageAndPay() function that accepts HBAR while updating a message
 """
 
-import os
 import sys
 
-from dotenv import load_dotenv
-
 from hiero_sdk_python import Client
 from hiero_sdk_python.contract.contract_create_transaction import (
     ContractCreateTransaction,
@@ -67,11 +64,6 @@ from hiero_sdk_python.response_code import ResponseCode
 from .contracts import STATEFUL_CONTRACT_BYTECODE
 
 
-load_dotenv()
-
-network_name = os.getenv("NETWORK", "testnet").lower()
-
-
 def setup_client() -> Client:
     """Setup Client."""
     client = Client.from_env()
@@ -18,11 +18,8 @@ Usage:
 """
 
 import datetime
-import os
 import sys
 
-from dotenv import load_dotenv
-
 from hiero_sdk_python import Client
 from hiero_sdk_python.contract.contract_create_transaction import (
     ContractCreateTransaction,
@@ -41,11 +38,6 @@ from hiero_sdk_python.timestamp import Timestamp
 from .contracts import SIMPLE_CONTRACT_BYTECODE
 
 
-load_dotenv()
-
-network_name = os.getenv("NETWORK", "testnet").lower()
-
-
 def setup_client() -> Client:
     """Setup Client."""
     client = Client.from_env()
@@ -46,8 +46,6 @@ from .contracts import STATEFUL_CONTRACT_BYTECODE
 
 load_dotenv()
 
-network_name = os.getenv("NETWORK", "testnet").lower()
-
 
 def setup_client() -> Client:
     """Setup Client."""
@@ -76,10 +74,11 @@ def create_alias_account(client):
     print(f"\nCreating alias account with public key: {alias_private_key.public_key().to_string()}")
 
     # Transfer HBAR to create a shallow account for the ECDSA key
+    amount_tinybars = Hbar(5).to_tinybars()
     receipt = (
         TransferTransaction()
-        .add_hbar_transfer(client.operator_account_id, -Hbar(5).to_tinybars())
-        .add_hbar_transfer(alias_account_id, Hbar(5).to_tinybars())
+        .add_hbar_transfer(client.operator_account_id, -amount_tinybars)
+        .add_hbar_transfer(alias_account_id, amount_tinybars)
         .execute(client)
     )
 
@@ -10,11 +10,8 @@ uv run examples/file_append_transaction.py
 python examples/file_append_transaction.py
 """
 
-import os
 import sys
 
-from dotenv import load_dotenv
-
 from hiero_sdk_python import (
     Client,
     FileAppendTransaction,
@@ -24,12 +21,6 @@ from hiero_sdk_python import (
 )
 
 
-# Load environment variables from .env file
-load_dotenv()
-
-network_name = os.getenv("NETWORK", "testnet").lower()
-
-
 def setup_client() -> Client:
     """Setup Client."""
     client = Client.from_env()
@@ -85,23 +76,21 @@ def append_file_large(client, file_id, file_private_key):
     print("\nAppending large content (multi-chunk)...")
     large_content = b"Large content that will be split into multiple chunks. " * 100
 
-    large_append_receipt = (
+    large_append_tx = (
         FileAppendTransaction()
         .set_file_id(file_id)
         .set_contents(large_content)
-        .set_chunk_size(1024)  # 1KB chunks
+        .set_chunk_size(4096)  # 4KB chunks (SDK default), within the 6KB transaction limit
         .set_max_chunks(50)  # Allow up to 50 chunks
-        .freeze_with(client)
-        .sign(file_private_key)
-        .execute(client)
     )
+    large_append_receipt = large_append_tx.freeze_with(client).sign(file_private_key).execute(client)
 
     if large_append_receipt.status != ResponseCode.SUCCESS:
         print(f"Large file append failed with status: {ResponseCode(large_append_receipt.status).name}")
         sys.exit(1)
 
     print("Large content appended successfully!")
-    print(f"Total chunks used: {FileAppendTransaction().set_contents(large_content).get_required_chunks()}")
+    print(f"Total chunks used: {large_append_tx.get_required_chunks()}")
 
 
 def main():
@@ -9,11 +9,8 @@ python examples/file_delete_transaction.py
 
 """
 
-import os
 import sys
 
-from dotenv import load_dotenv
-
 from hiero_sdk_python import Client, PrivateKey
 from hiero_sdk_python.file.file_create_transaction import FileCreateTransaction
 from hiero_sdk_python.file.file_delete_transaction import FileDeleteTransaction
@@ -22,11 +19,6 @@ from hiero_sdk_python.file.file_info_query import FileInfoQuery
 from hiero_sdk_python.response_code import ResponseCode
 
 
-load_dotenv()
-
-network_name = os.getenv("NETWORK", "testnet").lower()
-
-
 def setup_client() -> Client:
     """Setup Client."""
     client = Client.from_env()
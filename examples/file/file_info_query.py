@@ -7,22 +7,14 @@ uv run examples/file/file_info_query.py
 python examples/file/file_info_query.py
 """
 
-import os
 import sys
 
-from dotenv import load_dotenv
-
 from hiero_sdk_python import Client, PrivateKey
 from hiero_sdk_python.file.file_create_transaction import FileCreateTransaction
 from hiero_sdk_python.file.file_info_query import FileInfoQuery
 from hiero_sdk_python.response_code import ResponseCode
 
 
-load_dotenv()
-
-network_name = os.getenv("NETWORK", "testnet").lower()
-
-
 def setup_client() -> Client:
     """Setup Client."""
     client = Client.from_env()
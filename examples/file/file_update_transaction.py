@@ -7,11 +7,8 @@ uv run examples/file_update_transaction.py
 python examples/file_update_transaction.py
 """
 
-import os
 import sys
 
-from dotenv import load_dotenv
-
 from hiero_sdk_python import Client, PrivateKey
 from hiero_sdk_python.file.file_create_transaction import FileCreateTransaction
 from hiero_sdk_python.file.file_info_query import FileInfoQuery
@@ -19,11 +16,6 @@ from hiero_sdk_python.file.file_update_transaction import FileUpdateTransaction
 from hiero_sdk_python.response_code import ResponseCode
 
 
-load_dotenv()
-
-network_name = os.getenv("NETWORK", "testnet").lower()
-
-
 def setup_client() -> Client:
     """Setup Client."""
     client = Client.from_env()
@@ -13,10 +13,6 @@ Usage:
     python examples/logger/logging_example.py
 """
 
-import os
-
-from dotenv import load_dotenv
-
 from hiero_sdk_python import (
     AccountCreateTransaction,
     Client,
@@ -26,20 +22,17 @@ from hiero_sdk_python import (
 )
 
 
-load_dotenv()
-
-
-def setup_client() -> Client:
+def setup_client() -> tuple[Client, PrivateKey]:
     """
     Setup Client.
 
     Returns:
-        Client: Configured Hiero client ready for use
+        tuple[Client, PrivateKey]: Configured Hiero client ready for use and its operator key
     """
     client = Client.from_env()
     print(f"Network: {client.network.network}")
     print(f"Client set up with operator id {client.operator_account_id}")
-    return client
+    return client, client.operator_private_key
 
 
 def set_up_logging_level(client):
@@ -80,21 +73,19 @@ def create_key():
     return new_key
 
 
-def create_account(client, new_key, description=""):
+def create_account(client, operator_key, new_key, description=""):
     """
     Create a new account using the provided client and key.
 
     Args:
         client (Client): The Hiero client to use for the transaction
+        operator_key (PrivateKey): The operator's private key, used to sign the transaction
         new_key (PrivateKey): The private key for the new account
         description (str): Description for logging purposes
 
     Returns:
         str: The created account ID, or None if creation failed
     """
-    # Get operator key for signing
-    operator_key = PrivateKey.from_string(os.getenv("OPERATOR_KEY"))
-
     # Create account transaction
     transaction = (
         AccountCreateTransaction()
@@ -143,7 +134,7 @@ def show_logging_workflow():
 
     # Step 1: Set up client
     print("1. Setting up client...")
-    client = setup_client()
+    client, operator_key = setup_client()
     print(" Client setup complete")
     print()
 
@@ -161,7 +152,7 @@ def show_logging_workflow():
     # Step 4: Create account with logging enabled
     print("4. Creating account with TRACE logging enabled...")
     logging_status(client)
-    account_id_1 = create_account(client, new_key, "with trace logging ")
+    account_id_1 = create_account(client, operator_key, new_key, "with trace logging ")
     print()
 
     # Step 5: Disable logging
@@ -172,7 +163,7 @@ def show_logging_workflow():
 
     # Step 6: Create account with logging disabled
     print("6. Creating account with logging disabled...")
-    account_id_2 = create_account(client, new_key, "with disabled logging ")
+    account_id_2 = create_account(client, operator_key, new_key, "with disabled logging ")
     print()
 
     # Summary
@@ -9,22 +9,14 @@ You can set the range for the PRNG transaction to generate a pseudo-random numbe
 If no range is set, the PRNG transaction will generate a 48 byte unsigned pseudo-random number.
 """
 
-import os
 import sys
 
-from dotenv import load_dotenv
-
 from hiero_sdk_python import Client
 from hiero_sdk_python.prng_transaction import PrngTransaction
 from hiero_sdk_python.query.transaction_record_query import TransactionRecordQuery
 from hiero_sdk_python.response_code import ResponseCode
 
 
-load_dotenv()
-
-network_name = os.getenv("NETWORK", "testnet").lower()
-
-
 def setup_client() -> Client:
     """Setup Client."""
     client = Client.from_env()
@@ -97,11 +97,11 @@ def query_receipt():
 
     # Transfer Hbar to recipient account
     print("\nSTEP 2: Transferring Hbar...")
-    amount = 10
+    amount_tinybars = Hbar(10).to_tinybars()
     transaction = (
         TransferTransaction()
-        .add_hbar_transfer(operator_id, -Hbar(amount).to_tinybars())
-        .add_hbar_transfer(recipient_id, Hbar(amount).to_tinybars())
+        .add_hbar_transfer(operator_id, -amount_tinybars)
+        .add_hbar_transfer(recipient_id, amount_tinybars)
         .freeze_with(client)
         .sign(operator_key)
     )
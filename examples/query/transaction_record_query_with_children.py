@@ -25,10 +25,11 @@ def submit_alias_auto_create_transfer(client):
         alias_key = PrivateKey.generate_ecdsa()
         alias_account_id = AccountId.from_evm_address(alias_key.public_key().to_evm_address(), 0, 0)
 
+        amount_tinybars = Hbar(1).to_tinybars()
         transaction = (
             TransferTransaction()
-            .add_hbar_transfer(alias_account_id, Hbar(1).to_tinybars())
-            .add_hbar_transfer(client.operator_account_id, Hbar(-1).to_tinybars())
+            .add_hbar_transfer(alias_account_id, amount_tinybars)
+            .add_hbar_transfer(client.operator_account_id, -amount_tinybars)
         )
         transaction.execute(client)
 
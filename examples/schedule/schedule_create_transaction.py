@@ -8,12 +8,9 @@ python examples/schedule/schedule_create_transaction.py
 """
 
 import datetime
-import os
 import sys
 import time
 
-from dotenv import load_dotenv
-
 from hiero_sdk_python import Client, Hbar, PrivateKey
 from hiero_sdk_python.account.account_create_transaction import AccountCreateTransaction
 from hiero_sdk_python.query.account_balance_query import CryptoGetAccountBalanceQuery
@@ -23,11 +20,6 @@ from hiero_sdk_python.timestamp import Timestamp
 from hiero_sdk_python.transaction.transfer_transaction import TransferTransaction
 
 
-load_dotenv()
-
-network_name = os.getenv("NETWORK", "testnet").lower()
-
-
 def setup_client() -> Client:
     """Setup Client."""
     client = Client.from_env()
@@ -8,11 +8,8 @@ python examples/schedule/schedule_delete_transaction.py
 """
 
 import datetime
-import os
 import sys
 
-from dotenv import load_dotenv
-
 from hiero_sdk_python.account.account_create_transaction import AccountCreateTransaction
 from hiero_sdk_python.client.client import Client
 from hiero_sdk_python.crypto.private_key import PrivateKey
@@ -26,11 +23,6 @@ from hiero_sdk_python.timestamp import Timestamp
 from hiero_sdk_python.transaction.transfer_transaction import TransferTransaction
 
 
-load_dotenv()
-
-network_name = os.getenv("NETWORK", "testnet").lower()
-
-
 def setup_client() -> Client:
     """Setup Client."""
     client = Client.from_env()
@@ -8,11 +8,8 @@ python examples/schedule/schedule_info_query.py
 """
 
 import datetime
-import os
 import sys
 
-from dotenv import load_dotenv
-
 from hiero_sdk_python import (
     AccountCreateTransaction,
     Client,
@@ -25,11 +22,6 @@ from hiero_sdk_python import (
 )
 
 
-load_dotenv()
-
-network_name = os.getenv("NETWORK", "testnet").lower()
-
-
 def setup_client() -> Client:
     """Setup Client."""
     client = Client.from_env()
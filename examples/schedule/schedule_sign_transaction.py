@@ -19,11 +19,8 @@ python examples/schedule/schedule_sign_transaction.py
 """
 
 import datetime
-import os
 import sys
 
-from dotenv import load_dotenv
-
 from hiero_sdk_python import Client, Hbar, PrivateKey
 from hiero_sdk_python.account.account_create_transaction import AccountCreateTransaction
 from hiero_sdk_python.response_code import ResponseCode
@@ -33,11 +30,6 @@ from hiero_sdk_python.timestamp import Timestamp
 from hiero_sdk_python.transaction.transfer_transaction import TransferTransaction
 
 
-load_dotenv()
-
-network_name = os.getenv("NETWORK", "testnet").lower()
-
-
 def setup_client() -> Client:
     """Setup Client."""
     client = Client.from_env()
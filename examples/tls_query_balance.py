@@ -17,13 +17,10 @@ Run with:
 
 import os
 
-from dotenv import load_dotenv
-
 from hiero_sdk_python import (
     AccountId,
     Client,
     CryptoGetAccountBalanceQuery,
-    PrivateKey,
 )
 
 
@@ -34,19 +31,6 @@ def _bool_env(name: str, default: bool = False) -> bool:
     return value.strip().lower() in {"1", "true", "yes"}
 
 
-def _load_operator_credentials() -> tuple[AccountId, PrivateKey]:
-    """Load operator credentials from the environment."""
-    operator_id_str = os.getenv("OPERATOR_ID")
-    operator_key_str = os.getenv("OPERATOR_KEY")
-
-    if not operator_id_str or not operator_key_str:
-        raise ValueError("OPERATOR_ID and OPERATOR_KEY must be set in the environment")
-
-    operator_id = AccountId.from_string(operator_id_str)
-    operator_key = PrivateKey.from_string(operator_key_str)
-    return operator_id, operator_key
-
-
 def setup_client() -> Client:
     """Setup Client."""
     client = Client.from_env()
@@ -63,13 +47,9 @@ def query_account_balance(client: Client, account_id: AccountId):
 
 
 def main():
-    load_dotenv()
-
-    operator_id, operator_key = _load_operator_credentials()
     client = setup_client()
-    client.set_operator(operator_id, operator_key)
 
-    query_account_balance(client, operator_id)
+    query_account_balance(client, client.operator_account_id)
 
 
 if __name__ == "__main__":
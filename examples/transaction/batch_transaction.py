@@ -6,8 +6,7 @@ uv run examples/transaction/batch_transaction.py.
 """
 
 import sys
-
-from dotenv import load_dotenv
+from concurrent.futures import ThreadPoolExecutor
 
 from hiero_sdk_python import (
     AccountCreateTransaction,
@@ -24,13 +23,17 @@ from hiero_sdk_python import (
 )
 
 
-load_dotenv()
-
-
-def get_balance(client, account_id, token_id):
-    tokens_balance = CryptoGetAccountBalanceQuery(account_id=account_id).execute(client).token_balances
+def get_balances(client, account_ids, token_id):
+    """Query the token balances of several accounts concurrently and print them in the given order."""
+    with ThreadPoolExecutor(max_workers=len(account_ids)) as executor:
+        balance_queries = [
+            executor.submit(CryptoGetAccountBalanceQuery(account_id=account_id).execute, client)
+            for account_id in account_ids
+        ]
 
-    print(f"Account: {account_id}: {tokens_balance[token_id] if tokens_balance else 0}")
+    for account_id, balance_query in zip(account_ids, balance_queries, strict=True):
+        tokens_balance = balance_query.result().token_balances
+        print(f"Account: {account_id}: {tokens_balance[token_id] if tokens_balance else 0}")
 
 
 def setup_client() -> Client:
@@ -250,15 +253,13 @@ def main():
 
     # Show balances
     print("\nBalances before batch:")
-    get_balance(client, client.operator_account_id, token_id)
-    get_balance(client, recipient_id, token_id)
+    get_balances(client, [client.operator_account_id, recipient_id], token_id)
 
     # Batch unfreeze → transfer → freeze (using PrivateKey)
     perform_batch_tx(client, client.operator_account_id, recipient_id, token_id, freeze_key)
 
     print("\nBalances after first batch:")
-    get_balance(client, client.operator_account_id, token_id)
-    get_balance(client, recipient_id, token_id)
+    get_balances(client, [client.operator_account_id, recipient_id], token_id)
 
     # Verify that token is frozen again
     receipt = transfer_token(client, client.operator_account_id, recipient_id, token_id)
@@ -276,8 +277,7 @@ def main():
     perform_batch_tx_with_public_key(client, client.operator_account_id, recipient_id, token_id, freeze_key)
 
     print("\nBalances after second batch (with PublicKey):")
-    get_balance(client, client.operator_account_id, token_id)
-    get_balance(client, recipient_id, token_id)
+    get_balances(client, [client.operator_account_id, recipient_id], token_id)
 
     # Verify that token is frozen again
     receipt = transfer_token(client, client.operator_account_id, recipient_id, token_id)
@@ -6,11 +6,8 @@ uv run examples/transaction/transfer_transaction_fungible.py
 python examples/transaction/transfer_transaction_fungible.py
 """
 
-import os
 import sys
 
-from dotenv import load_dotenv
-
 from hiero_sdk_python import (
     AccountCreateTransaction,
     AccountId,
@@ -24,10 +21,6 @@ from hiero_sdk_python import (
 )
 
 
-load_dotenv()
-network_name = os.getenv("NETWORK", "testnet").lower()
-
-
 # --------------------------
 #  CLIENT SETUP
 # --------------------------
@@ -7,11 +7,8 @@ Usage:
     python examples/transaction/transfer_transaction_gigabar.py
 """
 
-import os
 import sys
 
-from dotenv import load_dotenv
-
 from hiero_sdk_python import (
     AccountCreateTransaction,
     AccountId,
@@ -25,11 +22,9 @@ from hiero_sdk_python import (
 )
 
 
-load_dotenv()
-network_name = os.getenv("NETWORK", "testnet").lower()
-
 # 0.00000001 Gigabars = 10 Hbar
 GIGABARS_TO_TRANSFER = 0.00000001
+GIGABAR_AMOUNT = Hbar.of(GIGABARS_TO_TRANSFER, HbarUnit.GIGABAR)
 
 
 def setup_client() -> tuple[Client, AccountId, PrivateKey]:
@@ -72,20 +67,18 @@ def transfer_gigabars(client, operator_id, recipient_id, operator_key):
     print(f"\nSTEP 2: Transferring {GIGABARS_TO_TRANSFER} GIGABARS...")
     print("(Note: 1 Gigabar = 1,000,000,000 Hbar)")
 
-    amount = Hbar.of(GIGABARS_TO_TRANSFER, HbarUnit.GIGABAR)
-
     try:
         receipt = (
             TransferTransaction()
-            .add_hbar_transfer(operator_id, amount.negated())
-            .add_hbar_transfer(recipient_id, amount)
+            .add_hbar_transfer(operator_id, GIGABAR_AMOUNT.negated())
+            .add_hbar_transfer(recipient_id, GIGABAR_AMOUNT)
             .freeze_with(client)
             .sign(operator_key)
             .execute(client)
         )
 
         if receipt.status == ResponseCode.SUCCESS:
-            print(f"✅ Success! Transferred {amount} successfully.")
+            print(f"✅ Success! Transferred {GIGABAR_AMOUNT} successfully.")
         else:
             print(f"❌ Failed with status: {receipt.status}")
             sys.exit(1)
@@ -7,11 +7,8 @@ Usage:
     python examples/transaction/transfer_transaction_hbar.py
 """
 
-import os
 import sys
 
-from dotenv import load_dotenv
-
 from hiero_sdk_python import (
     AccountCreateTransaction,
     AccountId,
@@ -24,10 +21,8 @@ from hiero_sdk_python import (
 )
 
 
-load_dotenv()
-network_name = os.getenv("NETWORK", "testnet").lower()
-
 HBAR_TO_TRANSFER = 1
+HBAR_AMOUNT = Hbar(HBAR_TO_TRANSFER)
 
 
 def setup_client() -> tuple[Client, AccountId, PrivateKey]:
@@ -72,20 +67,18 @@ def transfer_hbar(client, operator_id, recipient_id, operator_key):
     """Transfer HBAR from operator account to recipient account."""
     print("\nSTEP 2: Transferring HBAR...")
 
-    amount = Hbar(HBAR_TO_TRANSFER)  # HBAR object
-
     try:
         receipt = (
             TransferTransaction()
-            .add_hbar_transfer(operator_id, amount.negated())
-            .add_hbar_transfer(recipient_id, amount)
+            .add_hbar_transfer(operator_id, HBAR_AMOUNT.negated())
+            .add_hbar_transfer(recipient_id, HBAR_AMOUNT)
             .freeze_with(client)
             .sign(operator_key)
             .execute(client)
         )
 
         if receipt.status == ResponseCode.SUCCESS:
-            print(f"\n✅ Success! Transferred {amount} to {recipient_id}.")
+            print(f"\n✅ Success! Transferred {HBAR_AMOUNT} to {recipient_id}.")
             print(f"Transaction ID: {receipt.transaction_id}\n")
         else:
             print(f"\n❌ Unexpected status: {receipt.status}")
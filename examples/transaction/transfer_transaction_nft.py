@@ -6,11 +6,8 @@ uv run examples/transaction/transfer_transaction_nft.py
 python examples/transaction/transfer_transaction_nft.py
 """
 
-import os
 import sys
 
-from dotenv import load_dotenv
-
 from hiero_sdk_python import (
     AccountId,
     Client,
@@ -30,10 +27,6 @@ from hiero_sdk_python.tokens.token_mint_transaction import TokenMintTransaction
 from hiero_sdk_python.tokens.token_type import TokenType
 
 
-load_dotenv()
-network_name = os.getenv("NETWORK", "testnet").lower()
-
-
 def setup_client() -> tuple[Client, AccountId, PrivateKey]:
     """Setup Client."""
     client = Client.from_env()
@@ -7,11 +7,8 @@ Usage:
     python examples/transaction/transfer_transaction_tinybar.py
 """
 
-import os
 import sys
 
-from dotenv import load_dotenv
-
 from hiero_sdk_python import (
     AccountCreateTransaction,
     AccountId,
@@ -24,10 +21,8 @@ from hiero_sdk_python import (
 )
 
 
-load_dotenv()
-network_name = os.getenv("NETWORK", "testnet").lower()
-
 TINYBARS_TO_TRANSFER = 100_000_000
+TINYBAR_AMOUNT = Hbar.from_tinybars(TINYBARS_TO_TRANSFER)
 
 
 def setup_client() -> tuple[Client, AccountId, PrivateKey]:
@@ -97,20 +92,18 @@ def transfer_hbar_with_object(client, operator_id, recipient_id, operator_key):
     """Demonstrate modern approach using Hbar objects with Tinybar units."""
     print("\nSTEP 3: Transferring using Hbar Objects (Tinybar Unit)...")
 
-    amount = Hbar.from_tinybars(TINYBARS_TO_TRANSFER)
-
     try:
         receipt = (
             TransferTransaction()
-            .add_hbar_transfer(operator_id, amount.negated())
-            .add_hbar_transfer(recipient_id, amount)
+            .add_hbar_transfer(operator_id, TINYBAR_AMOUNT.negated())
+            .add_hbar_transfer(recipient_id, TINYBAR_AMOUNT)
             .freeze_with(client)
             .sign(operator_key)
             .execute(client)
         )
 
         if receipt.status == ResponseCode.SUCCESS:
-            print(f"✅ Success! Transferred {amount} (Object).")
+            print(f"✅ Success! Transferred {TINYBAR_AMOUNT} (Object).")
         else:
             print(f"❌ Failed with status: {receipt.status}")
             sys.exit(1)
@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from hiero_sdk_python.hapi.services.duration_pb2 import Duration as proto_Duration
 
 
-@dataclass(frozen=True, init=True)
+@dataclass(frozen=True, init=True, slots=True)
 class Duration:
     """A frozen dataclass representing a duration in seconds."""
 
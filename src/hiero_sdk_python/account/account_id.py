@@ -37,6 +37,9 @@ class AccountId:
     - The alias format is `<shardNum>.<realmNum>.<alias>`, where `alias` is the public key or evm address
     """
 
+    # Account IDs are created in bulk (transfer lists, token relationships, mirror node results)
+    __slots__ = ("shard", "realm", "num", "alias_key", "evm_address", "__checksum")
+
     def __init__(
         self,
         shard: int = 0,
@@ -377,14 +380,17 @@ class AccountId:
         Returns:
             bool: True if both instances are equal, False otherwise.
         """
+        if self is other:
+            return True
         if not isinstance(other, AccountId):
             return False
-        return (self.shard, self.realm, self.num, self.alias_key, self.evm_address) == (
-            other.shard,
-            other.realm,
-            other.num,
-            other.alias_key,
-            other.evm_address,
+        # Compare field by field, most selective first, without building tuples
+        return (
+            self.num == other.num
+            and self.realm == other.realm
+            and self.shard == other.shard
+            and self.alias_key == other.alias_key
+            and self.evm_address == other.evm_address
         )
 
     def __hash__(self) -> int:
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import threading
 from collections import namedtuple
+from collections.abc import Callable, Hashable
 from importlib.metadata import PackageNotFoundError, version
 
 import grpc
@@ -104,15 +106,17 @@ class _Channel:
 
     """
 
-    def __init__(self, grpc_channel=None):
+    def __init__(self, grpc_channel=None, pem_cert: bytes | None = None):
         """
         Initialize a new _Channel instance.
 
         Args:
             grpc_channel: The gRPC channel to wrap, obtained from a Client instance.
                           If None, service stub properties will return None when accessed.
+            pem_cert (bytes, optional): The PEM certificate the channel was secured with, if any.
         """
         self.channel = grpc_channel
+        self.pem_cert = pem_cert
 
         self._crypto = None
         self._file = None
@@ -295,3 +299,91 @@ class _Channel:
         if self._address_book is None and self.channel is not None:
             self._address_book = address_book_service_pb2_grpc.AddressBookServiceStub(self.channel)
         return self._address_book
+
+
+class _ChannelPool:
+    """
+    Process-wide pool of channels shared between nodes that target the same endpoint.
+
+    Every Network builds its own _Node objects, so two Clients for the same network would
+    otherwise dial (and, with TLS, fetch and validate the certificate of) every node twice.
+    Nodes acquire their channel from this pool under a key describing the endpoint and its
+    TLS settings; the pool keeps one channel per key and closes it once the last node
+    holding it releases it.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._channels: dict[Hashable, _Channel] = {}
+        self._ref_counts: dict[Hashable, int] = {}
+
+    def acquire(self, key: Hashable, factory: Callable[[], _Channel]) -> _Channel:
+        """
+        Return the pooled channel for ``key``, creating it with ``factory`` on first use.
+
+        If two threads open a channel for the same key at once, the first one pooled
+        wins and the other is closed.
+
+        Args:
+            key (Hashable): Identifies the endpoint and connection settings.
+            factory (Callable[[], _Channel]): Opens a new channel when none is pooled.
+
+        Returns:
+            _Channel: The shared channel for ``key``.
+        """
+        with self._lock:
+            channel = self._channels.get(key)
+            if channel is not None:
+                self._ref_counts[key] += 1
+                return channel
+
+        # Open the channel without holding the lock; TLS channels fetch the server
+        # certificate over the network, which must not stall every other node.
+        channel = factory()
+
+        with self._lock:
+            pooled = self._channels.get(key)
+            if pooled is None:
+                self._channels[key] = channel
+                self._ref_counts[key] = 1
+                return channel
+
+            self._ref_counts[key] += 1
+
+        # Another thread pooled a channel for this key first, keep that one
+        channel.channel.close()
+        return pooled
+
+    def release(self, key: Hashable) -> None:
+        """
+        Drop one reference to the channel for ``key`` and close it when no references remain.
+
+        Args:
+            key (Hashable): The key the channel was acquired with.
+        """
+        with self._lock:
+            ref_count = self._ref_counts.get(key)
+            if ref_count is None:
+                return
+
+            if ref_count > 1:
+                self._ref_counts[key] = ref_count - 1
+                return
+
+            del self._ref_counts[key]
+            channel = self._channels.pop(key)
+
+        channel.channel.close()
+
+    def clear(self) -> None:
+        """Close every pooled channel and empty the pool."""
+        with self._lock:
+            channels = list(self._channels.values())
+            self._channels.clear()
+            self._ref_counts.clear()
+
+        for channel in channels:
+            channel.channel.close()
+
+
+_CHANNEL_POOL = _ChannelPool()
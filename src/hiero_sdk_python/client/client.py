@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
+import copy
+import functools
 import math
 import os
 import warnings
@@ -9,7 +12,7 @@ from decimal import Decimal
 from typing import Literal, NamedTuple
 
 import grpc
-from dotenv import load_dotenv
+from dotenv import find_dotenv, load_dotenv
 
 from hiero_sdk_python.account.account_id import AccountId
 from hiero_sdk_python.crypto.private_key import PrivateKey
@@ -34,6 +37,27 @@ DEFAULT_MIN_BACKOFF = 0.25  # seconds
 NetworkName = Literal["mainnet", "testnet", "previewnet"]
 
 
+@functools.lru_cache(maxsize=8)
+def _load_dotenv_file(path: str, mtime_ns: int) -> None:  # noqa: ARG001
+    """Load a .env file once per path and modification time."""
+    load_dotenv(path)
+
+
+def _load_dotenv() -> None:
+    """
+    Load the nearest .env file, reading it again only if its path or modification
+    time changed since the last load. Existing variables are never overridden.
+    """
+    path = find_dotenv()
+    if not path:
+        return
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        return
+    _load_dotenv_file(path, mtime_ns)
+
+
 class Operator(NamedTuple):
     """A named tuple for the operator's account ID and private key."""
 
@@ -81,7 +105,8 @@ class Client:
     def from_env(cls, network: NetworkName | None = None) -> Client:
         """
         Initialize client from environment variables.
-        Automatically loads .env file if present.
+        Automatically loads .env file if present; the file is read again only
+        when it changes, and variables already set are never overridden.
 
         Args:
             network (str, optional): Override the network ("testnet", "mainnet", "previewnet").
@@ -95,7 +120,7 @@ class Client:
             # Defaults to testnet if no env vars set
             client = Client.from_env()
         """
-        load_dotenv()
+        _load_dotenv()
 
         network_name = network or (os.getenv("NETWORK") or "testnet")
 
@@ -189,6 +214,25 @@ class Client:
         self.operator_account_id = account_id
         self.operator_private_key = private_key
 
+    def with_operator(self, account_id: AccountId, private_key: PrivateKey) -> Client:
+        """
+        Return a client for a different operator that shares this client's network.
+
+        The returned client reuses the same node list, gRPC channels and node health
+        state, and copies this client's retry and timeout settings, so no new
+        connections are opened. Closing either client closes the shared network.
+
+        Args:
+            account_id (AccountId): The operator account ID for the returned client.
+            private_key (PrivateKey): The operator private key for the returned client.
+
+        Returns:
+            Client: A new client bound to the given operator.
+        """
+        client = copy.copy(self)
+        client.set_operator(account_id, private_key)
+        return client
+
     @property
     def operator(self) -> Operator | None:
         """
@@ -421,7 +465,7 @@ class Client:
 
     def update_network(self) -> Client:
         """Refresh the network node list from the mirror node."""
-        self.network._set_network_nodes()
+        self.network._set_network_nodes(refresh=True)
         return self
 
     def __enter__(self) -> Client:
@@ -434,3 +478,11 @@ class Client:
     def __exit__(self, exc_type, exc_value, traceback) -> None:
         """Automatically close channels when exiting 'with' block."""
         self.close()
+
+    async def __aenter__(self) -> Client:
+        """Allows the Client to be used in an 'async with' statement."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        """Close channels in a worker thread so the event loop is not blocked while they shut down."""
+        await asyncio.to_thread(self.close)
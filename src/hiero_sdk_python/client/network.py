@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import secrets
+import threading
 import time
 from typing import Any
 
@@ -15,6 +16,50 @@ from hiero_sdk_python.hapi.mirror import consensus_service_pb2_grpc as mirror_co
 from hiero_sdk_python.node import _Node
 
 
+# Networks that get TLS by default, and local networks that never query a mirror node for nodes
+_HOSTED_NETWORKS: frozenset[str] = frozenset({"mainnet", "testnet", "previewnet"})
+_LOCAL_NETWORKS: frozenset[str] = frozenset({"solo", "localhost", "local"})
+
+
+# Seconds a fetched mirror node address book is reused before it is queried again.
+_MIRROR_NODE_CACHE_TTL: float = 300.0
+
+# Keyed by mirror node URL; the key set is bounded by MIRROR_NODE_URLS.
+_mirror_node_cache: dict[str, tuple[float, tuple[dict[str, Any], ...]]] = {}
+_mirror_node_cache_lock = threading.Lock()
+
+
+def _fetch_mirror_node_addresses(url: str) -> tuple[dict[str, Any], ...]:
+    """
+    Fetch the raw node entries from a mirror node address book endpoint.
+
+    Results are cached per URL for _MIRROR_NODE_CACHE_TTL seconds so that creating
+    several clients for the same network in one process only queries the mirror
+    node once. Failed requests raise and empty address books are returned without
+    being cached, so the next call queries the mirror node again.
+    """
+    with _mirror_node_cache_lock:
+        cached = _mirror_node_cache.get(url)
+    if cached is not None and time.monotonic() - cached[0] < _MIRROR_NODE_CACHE_TTL:
+        return cached[1]
+
+    response: requests.Response = requests.get(url, timeout=30)  # Add 30 second timeout
+    response.raise_for_status()
+    data: dict[str, Any] = response.json()
+    nodes = tuple(data.get("nodes", []))
+
+    if nodes:
+        with _mirror_node_cache_lock:
+            _mirror_node_cache[url] = (time.monotonic(), nodes)
+    return nodes
+
+
+def _clear_mirror_node_cache() -> None:
+    """Drop every cached mirror node address book."""
+    with _mirror_node_cache_lock:
+        _mirror_node_cache.clear()
+
+
 class Network:
     """Manages the network configuration for connecting to the Hedera network."""
 
@@ -106,13 +151,14 @@ class Network:
         self.ledger_id = ledger_id or self.LEDGER_ID.get(self.network, bytes.fromhex("03"))
 
         # Default TLS configuration: enabled for hosted networks, disabled for local/custom
-        hosted_networks = ("mainnet", "testnet", "previewnet")
-        self._transport_security: bool = self.network in hosted_networks
+        self._transport_security: bool = self.network in _HOSTED_NETWORKS
         self._verify_certificates: bool = True  # Always enabled by default
         self._root_certificates: bytes | None = None
 
         self.nodes: list[_Node] = []
         self._healthy_nodes: list[_Node] = []
+        # Guards node selection and health bookkeeping, requests on one client may run in several threads
+        self._nodes_lock = threading.RLock()
 
         self._set_network_nodes(nodes)
 
@@ -144,8 +190,18 @@ class Network:
             self._mirror_address = value
             self._close_mirror_node()
 
-    def _set_network_nodes(self, nodes: list[_Node] | None = None):
-        """Configure the consensus nodes used by this network."""
+    def _set_network_nodes(self, nodes: list[_Node] | None = None, refresh: bool = False):
+        """
+        Configure the consensus nodes used by this network.
+
+        Args:
+            nodes (list, optional): Explicit nodes to use instead of fetching them.
+            refresh (bool): If True, re-query the mirror node instead of reusing
+                a cached address book.
+        """
+        if refresh:
+            _clear_mirror_node_cache()
+
         final_nodes = self._resolve_nodes(nodes)
 
         # Apply TLS configuration to all nodes
@@ -155,19 +211,20 @@ class Network:
             node._set_verify_certificates(self._verify_certificates)  # pylint: disable=protected-access
             node._set_root_certificates(self._root_certificates)  # pylint: disable=protected-access
 
-        self.nodes = final_nodes
-        self._healthy_nodes = []
+        with self._nodes_lock:
+            self.nodes = final_nodes
+            self._healthy_nodes = []
 
-        for node in self.nodes:
-            if not node.is_healthy():
-                continue
-            self._healthy_nodes.append(node)
+            for node in self.nodes:
+                if not node.is_healthy():
+                    continue
+                self._healthy_nodes.append(node)
 
     def _resolve_nodes(self, nodes: list[_Node] | None) -> list[_Node]:
         if nodes:
             return nodes
 
-        if self.network in ("solo", "localhost", "local"):
+        if self.network in _LOCAL_NETWORKS:
             return self._fetch_nodes_from_default_nodes()
 
         fetched = self._fetch_nodes_from_mirror_node()
@@ -194,13 +251,9 @@ class Network:
         url: str = f"{base_url}/api/v1/network/nodes?limit=100&order=desc"
 
         try:
-            response: requests.Response = requests.get(url, timeout=30)  # Add 30 second timeout
-            response.raise_for_status()
-            data: dict[str, Any] = response.json()
-
             nodes: list[_Node] = []
             # Process each node from the mirror node API response
-            for node in data.get("nodes", []):
+            for node in _fetch_mirror_node_addresses(url):
                 address_book: NodeAddress = NodeAddress._from_dict(node)
                 account_id: AccountId = address_book._account_id
                 address: str = str(address_book._addresses[0])
@@ -229,16 +282,17 @@ class Network:
         Returns:
             _Node: The selected node instance.
         """
-        self._readmit_nodes()
+        with self._nodes_lock:
+            self._readmit_nodes()
 
-        if not self._healthy_nodes:
-            raise ValueError("No healthy node available to select")
+            if not self._healthy_nodes:
+                raise ValueError("No healthy node available to select")
 
-        self._node_index %= len(self._healthy_nodes)
-        self._node_index = (self._node_index + 1) % len(self._healthy_nodes)
+            self._node_index %= len(self._healthy_nodes)
+            self._node_index = (self._node_index + 1) % len(self._healthy_nodes)
 
-        self.current_node = self._healthy_nodes[self._node_index]
-        return self.current_node
+            self.current_node = self._healthy_nodes[self._node_index]
+            return self.current_node
 
     def _get_node(self, account_id: AccountId) -> _Node | None:
         """
@@ -381,24 +435,25 @@ class Network:
         if self._earliest_readmit_time > now:
             return
 
-        next_readmit = float("inf")
+        with self._nodes_lock:
+            next_readmit = float("inf")
 
-        for node in self.nodes:
-            if node in self._healthy_nodes:
-                continue
+            for node in self.nodes:
+                if node in self._healthy_nodes:
+                    continue
 
-            if node._readmit_time > now:
-                next_readmit = min(next_readmit, node._readmit_time)
-                continue
+                if node._readmit_time > now:
+                    next_readmit = min(next_readmit, node._readmit_time)
+                    continue
 
-            self._mark_node_healthy(node)
+                self._mark_node_healthy(node)
 
-        delay = min(
-            self._node_max_readmit_period,
-            max(self._node_min_readmit_period, next_readmit - now),
-        )
+            delay = min(
+                self._node_max_readmit_period,
+                max(self._node_min_readmit_period, next_readmit - now),
+            )
 
-        self._earliest_readmit_time = now + delay
+            self._earliest_readmit_time = now + delay
 
     def _increase_backoff(self, node: _Node) -> None:
         """Increase the node's backoff duration after a failure and remove node from healthy node."""
@@ -419,15 +474,17 @@ class Network:
         if not isinstance(node, _Node):
             raise TypeError("node must be of type _Node")
 
-        if node in self._healthy_nodes:
-            self._healthy_nodes.remove(node)
+        with self._nodes_lock:
+            if node in self._healthy_nodes:
+                self._healthy_nodes.remove(node)
 
     def _mark_node_healthy(self, node: _Node) -> None:
         if not isinstance(node, _Node):
             raise TypeError("node must be of type _Node")
 
-        if node not in self._healthy_nodes:
-            self._healthy_nodes.append(node)
+        with self._nodes_lock:
+            if node not in self._healthy_nodes:
+                self._healthy_nodes.append(node)
 
     def _close_mirror_node(self):
         """Safely closes the mirror gRPC channel."""
@@ -56,11 +56,7 @@ class TopicId:
         Returns:
             basic_types_pb2.TopicID: The protobuf TopicID representation.
         """
-        topic_id_proto = basic_types_pb2.TopicID()
-        topic_id_proto.shardNum = self.shard
-        topic_id_proto.realmNum = self.realm
-        topic_id_proto.topicNum = self.num
-        return topic_id_proto
+        return basic_types_pb2.TopicID(shardNum=self.shard, realmNum=self.realm, topicNum=self.num)
 
     def __str__(self) -> str:
         """
@@ -92,25 +92,17 @@ class TopicMessage:
         )
 
         chunks: list[TopicMessageChunk] = []
-        total_size: int = 0
         transaction_id: TransactionId | None = None
 
         for r in sorted_responses:
             c = TopicMessageChunk(r)
             chunks.append(c)
 
-            total_size += len(r.message)
-
             if transaction_id is None and r.HasField("chunkInfo") and r.chunkInfo.HasField("initialTransactionID"):
                 transaction_id = TransactionId._from_proto(r.chunkInfo.initialTransactionID)
 
-        contents = bytearray(total_size)
-
-        offset: int = 0
-        for r in sorted_responses:
-            end = offset + len(r.message)
-            contents[offset:end] = r.message
-            offset = end
+        # join sizes the result once and copies each chunk a single time
+        contents: bytes = b"".join(r.message for r in sorted_responses)
 
         last_r: mirror_proto.ConsensusTopicResponse = sorted_responses[-1]
         consensus_timestamp: datetime = Timestamp._from_protobuf(last_r.consensusTimestamp).to_date()
@@ -120,7 +112,7 @@ class TopicMessage:
         return cls(
             consensus_timestamp,
             {
-                "contents": bytes(contents),
+                "contents": contents,
                 "running_hash": running_hash,
                 "sequence_number": sequence_number,
             },
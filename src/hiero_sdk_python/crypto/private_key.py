@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import warnings
 
-from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric import (
     ec,
     ed25519,
@@ -14,7 +14,7 @@ from cryptography.hazmat.primitives.asymmetric import (
 from hiero_sdk_python.crypto.key import Key
 from hiero_sdk_python.crypto.public_key import PublicKey
 from hiero_sdk_python.hapi.services import basic_types_pb2
-from hiero_sdk_python.utils.crypto_utils import keccak256
+from hiero_sdk_python.utils.crypto_utils import ECDSA_PREHASHED_SHA256, SECP256K1_CURVE, keccak256
 
 
 _LEGACY_ECDSA_PRIVATE_KEY_PREFIX = "3030020100300706052b8104000a04220420"
@@ -30,6 +30,9 @@ class PrivateKey(Key):
     def __init__(self, private_key: ec.EllipticCurvePrivateKey | ed25519.Ed25519PrivateKey) -> None:
         """Initializes a PrivateKey from a cryptography PrivateKey object."""
         self._private_key: ec.EllipticCurvePrivateKey | ed25519.Ed25519PrivateKey = private_key
+        # Derived lazily by public_key() and reused, keys are immutable
+        self._public_key: PublicKey | None = None
+        self._raw_bytes: bytes | None = None
 
     #
     # ---------------------------------
@@ -108,9 +111,10 @@ class PrivateKey(Key):
     @classmethod
     def generate(cls, key_type: str = "ed25519") -> PrivateKey:
         """Generate a new private key, defaulting to ed25519. key_type can be "ed25519" or "ecdsa"."""
-        if key_type.lower() == "ed25519":
+        key_type = key_type.lower()
+        if key_type == "ed25519":
             return cls.generate_ed25519()
-        if key_type.lower() == "ecdsa":
+        if key_type == "ecdsa":
             return cls.generate_ecdsa()
         raise ValueError("Invalid key_type. Use 'ed25519' or 'ecdsa'.")
 
@@ -122,7 +126,7 @@ class PrivateKey(Key):
     @classmethod
     def generate_ecdsa(cls) -> PrivateKey:
         """Generate a new ECDSA (secp256k1) private key."""
-        private_key = ec.generate_private_key(ec.SECP256K1())
+        private_key = ec.generate_private_key(SECP256K1_CURVE)
         return cls(private_key)
 
     #
@@ -186,7 +190,7 @@ class PrivateKey(Key):
             private_int = int.from_bytes(key_bytes, "big")
             if private_int == 0:
                 return None
-            return ec.derive_private_key(private_int, ec.SECP256K1())
+            return ec.derive_private_key(private_int, SECP256K1_CURVE)
         except Exception:
             return None
 
@@ -235,7 +239,7 @@ class PrivateKey(Key):
             if private_int == 0:
                 raise ValueError("ECDSA private key scalar cannot be zero.")
 
-            ec_priv = ec.derive_private_key(private_int, ec.SECP256K1())
+            ec_priv = ec.derive_private_key(private_int, SECP256K1_CURVE)
             return cls(ec_priv)
         except Exception as e:
             raise ValueError(f"Could not load ECDSA private key from scalar: {e}") from e
@@ -286,13 +290,19 @@ class PrivateKey(Key):
             return self._private_key.sign(data)
 
         data_hash = keccak256(data)
-        signature_der = self._private_key.sign(data_hash, ec.ECDSA(asym_utils.Prehashed(hashes.SHA256())))
+        signature_der = self._private_key.sign(data_hash, ECDSA_PREHASHED_SHA256)
         r, s = asym_utils.decode_dss_signature(signature_der)
         return r.to_bytes(32, "big") + s.to_bytes(32, "big")
 
     def public_key(self) -> PublicKey:
-        """Derive the public key from this private key."""
-        return PublicKey(self._private_key.public_key())
+        """
+        Derive the public key from this private key.
+
+        The public key is derived on the first call and the same instance is returned afterwards.
+        """
+        if self._public_key is None:
+            self._public_key = PublicKey(self._private_key.public_key())
+        return self._public_key
 
     #
     # ---------------------------------
@@ -302,21 +312,21 @@ class PrivateKey(Key):
 
     def to_bytes_raw(self) -> bytes:
         """Return the raw 32-byte seed (Ed25519) or 32-byte scalar (ECDSA)."""
-        if self.is_ed25519():
-            return self.to_bytes_ed25519_raw()
-        if self.is_ecdsa():
-            return self.to_bytes_ecdsa_raw()
-        raise ValueError("Unknown key type; cannot extract raw bytes.")
+        # Backs to_string() and __repr__, so serialize only once
+        if self._raw_bytes is None:
+            if self.is_ed25519():
+                self._raw_bytes = self.to_bytes_ed25519_raw()
+            elif self.is_ecdsa():
+                self._raw_bytes = self.to_bytes_ecdsa_raw()
+            else:
+                raise ValueError("Unknown key type; cannot extract raw bytes.")
+        return self._raw_bytes
 
     def to_bytes_ed25519_raw(self) -> bytes:
         """Return the raw 32-byte Ed25519 seed."""
         if not self.is_ed25519():
             raise ValueError("Not an Ed25519 key.")
-        return self._private_key.private_bytes(
-            encoding=serialization.Encoding.Raw,
-            format=serialization.PrivateFormat.Raw,
-            encryption_algorithm=serialization.NoEncryption(),
-        )
+        return self._private_key.private_bytes_raw()
 
     def to_bytes_ecdsa_raw(self) -> bytes:
         """Return the raw 32-byte ECDSA (secp256k1) scalar."""
@@ -431,7 +441,7 @@ class PrivateKey(Key):
             raise ValueError("ECDSA private key scalar cannot be zero")
 
         try:
-            return ec.derive_private_key(private_int, ec.SECP256K1())
+            return ec.derive_private_key(private_int, SECP256K1_CURVE)
         except Exception as exc:
             raise ValueError(f"Failed to derive ECDSA private key: {exc}") from exc
 
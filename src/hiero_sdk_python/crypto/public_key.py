@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import warnings
 
-from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric import (
     ec,
     ed25519,
@@ -15,7 +15,7 @@ from hiero_sdk_python.contract.contract_id import ContractId
 from hiero_sdk_python.crypto.evm_address import EvmAddress
 from hiero_sdk_python.crypto.key import Key
 from hiero_sdk_python.hapi.services import basic_types_pb2
-from hiero_sdk_python.utils.crypto_utils import keccak256
+from hiero_sdk_python.utils.crypto_utils import ECDSA_PREHASHED_SHA256, SECP256K1_CURVE, keccak256
 
 
 def _warn_ed25519_ambiguity(caller_name: str) -> None:
@@ -38,6 +38,12 @@ class PublicKey(Key):
     def __init__(self, public_key: ec.EllipticCurvePublicKey | ed25519.Ed25519PublicKey) -> None:
         """Initializes a PublicKey from a cryptography PublicKey object."""
         self._public_key: ec.EllipticCurvePublicKey | ed25519.Ed25519PublicKey = public_key
+        # Raw (compressed for ECDSA) encoding, computed once by to_bytes_raw()
+        self._raw_bytes: bytes | None = None
+        # DER SubjectPublicKeyInfo encoding, computed once by to_bytes_der()
+        self._der_bytes: bytes | None = None
+        # EVM address bytes for ECDSA keys, computed once by to_evm_address()
+        self._evm_address_bytes: bytes | None = None
 
     #
     # ---------------------------------
@@ -139,7 +145,7 @@ class PublicKey(Key):
 
         # 2) Delegate to cryptography ec library for point decoding and validation
         try:
-            ec_pub = ec.EllipticCurvePublicKey.from_encoded_point(ec.SECP256K1(), pub)
+            ec_pub = ec.EllipticCurvePublicKey.from_encoded_point(SECP256K1_CURVE, pub)
         except Exception as e:
             # Raised if bytes do not correspond to a valid curve point
             raise ValueError(f"Invalid ECDSA public key bytes: {e}") from e
@@ -385,17 +391,19 @@ class PublicKey(Key):
             - If `is_ed25519() == True`, a 32-byte Ed25519 point.
             - Otherwise, a 33-byte compressed secp256k1 point.
         """
-        if self.is_ed25519():
-            return self.to_bytes_ed25519()
-        # ECDSA
-        return self.to_bytes_ecdsa()
+        # Used for signature prefixes, equality and hashing, so serialize only once
+        if self._raw_bytes is None:
+            self._raw_bytes = self.to_bytes_ed25519() if self.is_ed25519() else self.to_bytes_ecdsa()
+        return self._raw_bytes
 
     def to_bytes_ed25519(self) -> bytes:
         """
         Specific name for clarity.
         Returns the Ed25519 public key in 32-bytes raw form.
         """
-        return self._public_key.public_bytes(encoding=serialization.Encoding.Raw, format=serialization.PublicFormat.Raw)
+        if not self.is_ed25519():
+            raise ValueError("Not an Ed25519 key.")
+        return self._public_key.public_bytes_raw()
 
     def to_bytes_ecdsa(self, compressed: bool = True) -> bytes:
         """
@@ -409,9 +417,11 @@ class PublicKey(Key):
 
     def to_bytes_der(self) -> bytes:
         """Returns the DER-encoded public key."""
-        return self._public_key.public_bytes(
-            encoding=serialization.Encoding.DER, format=serialization.PublicFormat.SubjectPublicKeyInfo
-        )
+        if self._der_bytes is None:
+            self._der_bytes = self._public_key.public_bytes(
+                encoding=serialization.Encoding.DER, format=serialization.PublicFormat.SubjectPublicKeyInfo
+            )
+        return self._der_bytes
 
     @classmethod
     def _encode_vlq(cls, value: int) -> bytes:
@@ -563,11 +573,13 @@ class PublicKey(Key):
         if self.is_ed25519():
             raise ValueError("Cannot derive an EVM address from an Ed25519 key.")
 
-        uncompressed_bytes = self.to_bytes_ecdsa(compressed=False)
-        keccak_bytes = keccak256(uncompressed_bytes[1:])
-        evm_address = keccak_bytes[-20:]
+        if self._evm_address_bytes is None:
+            uncompressed_bytes = self.to_bytes_ecdsa(compressed=False)
+            keccak_bytes = keccak256(uncompressed_bytes[1:])
+            self._evm_address_bytes = keccak_bytes[-20:]
 
-        return EvmAddress.from_bytes(evm_address)
+        # EvmAddress is mutable, so hand out a fresh instance each time
+        return EvmAddress.from_bytes(self._evm_address_bytes)
 
     #
     # ----------------------------
@@ -621,7 +633,7 @@ class PublicKey(Key):
             signature_der = signature
 
         data_hash = keccak256(data)
-        self._public_key.verify(signature_der, data_hash, ec.ECDSA(asym_utils.Prehashed(hashes.SHA256())))
+        self._public_key.verify(signature_der, data_hash, ECDSA_PREHASHED_SHA256)
 
     def __repr__(self) -> str:
         """Returns a string representation of the PublicKey."""
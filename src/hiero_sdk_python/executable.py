@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import math
 import re
 import time
@@ -371,13 +372,18 @@ class _Executable(ABC):
         """Calculate backoff for the given attempt, attempt start from 0."""
         return min(self._max_backoff, self._min_backoff * (2 ** (attempt + 1)))
 
-    def _handle_unhealthy_node(self, proto_request, attempt, logger, err) -> bool:
+    def _calculate_delay(self, attempt: int, start: float) -> float:
+        """Calculate the backoff for the given attempt, clipped to the time left before the request timeout."""
+        remaining = self._request_timeout - (time.monotonic() - start)
+        return max(0.0, min(self._calculate_backoff(attempt), remaining))
+
+    def _handle_unhealthy_node(self, proto_request, attempt, logger, err, start) -> bool:
         """Handle node switching and backoff for unhealthy node."""
         # Check if the request is a transaction receipt or record because they are single node requests
         if _is_transaction_receipt_or_record_request(proto_request):
             _delay_for_attempt(
                 self._get_request_id(),
-                self._min_backoff,
+                self._calculate_delay(attempt, start),
                 attempt,
                 logger,
                 err,
@@ -456,7 +462,7 @@ class _Executable(ABC):
             proto_request = self._make_request()
 
             if not node.is_healthy():
-                self._handle_unhealthy_node(proto_request, attempt, logger, err_persistant)
+                self._handle_unhealthy_node(proto_request, attempt, logger, err_persistant, start)
                 continue
 
             # Execute the GRPC call
@@ -504,7 +510,7 @@ class _Executable(ABC):
                     err_persistant = status_error
                     _delay_for_attempt(
                         self._get_request_id(),
-                        self._calculate_backoff(attempt),
+                        self._calculate_delay(attempt, start),
                         attempt,
                         logger,
                         err_persistant,
@@ -533,6 +539,24 @@ class _Executable(ABC):
             err_persistant,
         )
 
+    async def execute_async(self, client: Client, *args: Any, **kwargs: Any) -> Any:
+        """
+        Awaitable variant of execute().
+
+        The blocking execute() call, including its retries and any receipt wait, runs in a
+        worker thread, so independent transactions and queries can be awaited together with
+        asyncio.gather() and their network round-trips overlap.
+
+        Args:
+            client (Client): The client instance to use for execution.
+            *args: Positional arguments forwarded to execute().
+            **kwargs: Keyword arguments forwarded to execute().
+
+        Returns:
+            Whatever execute() returns for this transaction or query.
+        """
+        return await asyncio.to_thread(self.execute, client, *args, **kwargs)
+
 
 def _is_transaction_receipt_or_record_request(
     request: transaction_pb2.Transaction | query_pb2.Query,
@@ -27,6 +27,8 @@ class Hbar:
     the network utility token, whatever its designation may be.
     """
 
+    __slots__ = ("_amount_in_tinybar",)
+
     ZERO: ClassVar[Hbar]
     MAX: ClassVar[Hbar]
     MIN: ClassVar[Hbar]
@@ -53,7 +55,12 @@ class Hbar:
             self._amount_in_tinybar = int(amount)
             return
 
-        if isinstance(amount, (float, int)):
+        if isinstance(amount, int):
+            # Whole amounts of any unit are always a whole number of tinybars
+            self._amount_in_tinybar = amount * unit.tinybar
+            return
+
+        if isinstance(amount, float):
             amount = Decimal(str(amount))
 
         tinybar = amount * Decimal(unit.tinybar)
@@ -177,10 +184,9 @@ class Hbar:
         if not match:
             raise ValueError(f"Invalid Hbar format: '{amount}'")
 
-        parts = amount.split(" ")
-        value = Decimal(parts[0])
-        unit = HbarUnit.from_string(parts[1]) if len(parts) == 2 else unit
-        return cls(value, unit=unit)
+        number, symbol = match.group(1), match.group(3)
+        unit = HbarUnit.from_string(symbol) if symbol else unit
+        return cls(Decimal(number), unit=unit)
 
     def __str__(self) -> str:
         return f"{self.to_hbars():.8f} ℏ"
@@ -42,8 +42,10 @@ class HbarUnit(Enum):
         Returns:
             HbarUnit: The corresponding enumeration member.
         """
-        for unit in cls:
-            if unit.symbol == symbol:
-                return unit
+        unit = _UNIT_BY_SYMBOL.get(symbol)
+        if unit is None:
+            raise ValueError(f"Invalid Hbar unit symbol: {symbol}")
+        return unit
 
-        raise ValueError(f"Invalid Hbar unit symbol: {symbol}")
+
+_UNIT_BY_SYMBOL: dict[str, HbarUnit] = {unit.symbol: unit for unit in HbarUnit}
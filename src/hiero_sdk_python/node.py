@@ -3,13 +3,14 @@ from __future__ import annotations
 import hashlib
 import socket
 import ssl  # Python's ssl module implements TLS (despite the name)
+import threading
 import time
 
 import grpc
 
 from hiero_sdk_python.account.account_id import AccountId
 from hiero_sdk_python.address_book.node_address import NodeAddress
-from hiero_sdk_python.channels import _Channel, _UserAgentInterceptor
+from hiero_sdk_python.channels import _CHANNEL_POOL, _Channel, _UserAgentInterceptor
 from hiero_sdk_python.managed_node_address import _ManagedNodeAddress
 
 
@@ -89,6 +90,9 @@ class _Node:
         """
         self._account_id: AccountId = account_id
         self._channel: _Channel | None = None
+        self._channel_key: tuple | None = None
+        # Guards lazy channel creation so concurrent executions share a single channel
+        self._channel_lock = threading.Lock()
         self._address_book: NodeAddress = address_book
         self._address: _ManagedNodeAddress = _ManagedNodeAddress._from_string(address)
         self._verify_certificates: bool = True
@@ -109,19 +113,56 @@ class _Node:
             None
         """
         if self._channel is not None:
-            self._channel.channel.close()
+            _CHANNEL_POOL.release(self._channel_key)
             self._channel = None
+            self._channel_key = None
 
     def _get_channel(self):
         """
         Get the channel for this node.
 
+        The channel is acquired lazily on first use from the process-wide channel pool,
+        so nodes of different Networks pointing at the same endpoint share one connection.
+        Acquisition is guarded by a lock so that a Client shared between threads holds
+        only one channel per node.
+
         Returns:
             _Channel: The channel for this node.
         """
         if self._channel:
             return self._channel
 
+        with self._channel_lock:
+            if self._channel:
+                return self._channel
+
+            channel_key = self._get_channel_key()
+            self._channel = _CHANNEL_POOL.acquire(channel_key, self._create_channel)
+            self._channel_key = channel_key
+
+            # A channel opened by another node carries the certificate it was secured with
+            if self._channel.pem_cert is not None:
+                self._node_pem_cert = self._channel.pem_cert
+
+        return self._channel
+
+    def _get_channel_key(self) -> tuple:
+        """
+        Build the pool key for this node's channel.
+
+        Nodes may only share a channel when they agree on the endpoint and on every
+        setting that influences how the channel is secured.
+        """
+        cert_hash = self._address_book._cert_hash if self._address_book else None
+        return (str(self._address), self._root_certificates, self._verify_certificates, cert_hash)
+
+    def _create_channel(self) -> _Channel:
+        """
+        Open a new channel to this node, fetching and validating its certificate when TLS is enabled.
+
+        Returns:
+            _Channel: The newly created channel.
+        """
         if self._address._is_transport_security():
             if self._root_certificates:
                 # Use the certificate that is provided
@@ -145,14 +186,14 @@ class _Node:
                 certificate_chain=None,
             )
             channel = grpc.secure_channel(str(self._address), credentials, options=options)
+            pem_cert = self._node_pem_cert
         else:
             channel = grpc.insecure_channel(str(self._address))
+            pem_cert = None
 
         channel = grpc.intercept_channel(channel, _UserAgentInterceptor())
 
-        self._channel = _Channel(channel)
-
-        return self._channel
+        return _Channel(channel, pem_cert)
 
     def _apply_transport_security(self, enabled: bool):
         """Update the node's address to use secure or insecure transport."""
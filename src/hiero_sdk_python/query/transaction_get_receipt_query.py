@@ -19,6 +19,10 @@ from hiero_sdk_python.transaction.transaction_id import TransactionId
 from hiero_sdk_python.transaction.transaction_receipt import TransactionReceipt
 
 
+# Receipts are usually available a few seconds after submission, so poll more often than the general max backoff
+RECEIPT_MAX_BACKOFF = 2.0  # seconds
+
+
 class TransactionGetReceiptQuery(Query):
     """
     A query to retrieve the receipt of a specific transaction from the Hedera network.
@@ -203,6 +207,16 @@ class TransactionGetReceiptQuery(Query):
         """
         return _Method(transaction_func=None, query_func=channel.crypto.getTransactionReceipts)
 
+    def _calculate_backoff(self, attempt: int) -> float:
+        """
+        Calculate backoff for the given attempt, capped at RECEIPT_MAX_BACKOFF while polling.
+
+        The cap never overrides the configured backoff range: the result stays within
+        the minimum and maximum backoff set on the query or client.
+        """
+        backoff = min(super()._calculate_backoff(attempt), RECEIPT_MAX_BACKOFF, self._max_backoff)
+        return max(backoff, self._min_backoff)
+
     def _should_retry(self, response: response_pb2.Response) -> _ExecutionState:
         """
         Determines whether the query should be retried based on the response.
@@ -13,6 +13,8 @@ secure_random = secrets.SystemRandom()
 class Timestamp:
     """Represents a specific moment in time with nanosecond precision."""
 
+    __slots__ = ("seconds", "nanos")
+
     MAX_NS = 1_000_000_000
 
     def __init__(self, seconds: int, nanos: int):
@@ -20,7 +20,7 @@ from hiero_sdk_python.utils.entity_id_helper import (
 )
 
 
-@dataclass(frozen=True, eq=True, init=True, repr=True)
+@dataclass(frozen=True, eq=True, init=True, repr=True, slots=True)
 class TokenId:
     """Represents an immutable Hedera token identifier (shard, realm, num).
 
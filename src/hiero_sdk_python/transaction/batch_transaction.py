@@ -9,6 +9,9 @@ atomic operation on the Hedera network.
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
 from hiero_sdk_python.channels import _Channel
 from hiero_sdk_python.executable import _Method
 from hiero_sdk_python.hapi.services import transaction_pb2
@@ -18,6 +21,15 @@ from hiero_sdk_python.transaction.transaction import Transaction
 from hiero_sdk_python.transaction.transaction_id import TransactionId
 
 
+if TYPE_CHECKING:
+    from hiero_sdk_python.client.client import Client
+    from hiero_sdk_python.transaction.transaction_receipt import TransactionReceipt
+
+
+# Upper bound on concurrent receipt queries; a batch may hold up to 50 inner transactions
+_MAX_RECEIPT_WORKERS = 8
+
+
 class BatchTransaction(Transaction):
     """Represents an atomic batch transaction on the Hedera network."""
 
@@ -78,6 +90,34 @@ class BatchTransaction(Transaction):
         """
         return [transaction.transaction_id for transaction in self.inner_transactions]
 
+    def get_inner_receipts(self, client: Client, timeout: int | float | None = None) -> list[TransactionReceipt]:
+        """
+        Retrieve the receipts of all inner batch transactions.
+
+        The network has no batched receipt query, so one receipt query is issued per inner
+        transaction. Up to _MAX_RECEIPT_WORKERS queries are sent at a time. They all run on
+        the given client and share its node channels, so they are multiplexed on the same
+        connections instead of waiting on each other.
+
+        Args:
+            client (Client): The client instance to query the receipts with.
+            timeout (int | float, optional): The total execution timeout (in seconds) for each query.
+
+        Returns:
+            list[TransactionReceipt]: The receipts, in the same order as the inner transactions.
+        """
+        from hiero_sdk_python.query.transaction_get_receipt_query import TransactionGetReceiptQuery
+
+        transaction_ids = self.get_inner_transaction_ids()
+        if not transaction_ids:
+            return []
+
+        def get_receipt(transaction_id: TransactionId) -> TransactionReceipt:
+            return TransactionGetReceiptQuery().set_transaction_id(transaction_id).execute(client, timeout)
+
+        with ThreadPoolExecutor(max_workers=min(len(transaction_ids), _MAX_RECEIPT_WORKERS)) as executor:
+            return list(executor.map(get_receipt, transaction_ids))
+
     def _verify_inner_transaction(self, transaction: Transaction) -> None:
         """
         Validate that a transaction can be included as an inner batch transaction.
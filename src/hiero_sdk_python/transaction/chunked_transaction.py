@@ -277,6 +277,7 @@ class ChunkedTransaction(Transaction, ABC):
             # Clear the frozen state to rebuild the body for this chunk.
             self._transaction_body_bytes.clear()
             self._signature_map.clear()
+            self._signed_transaction_bytes.clear()
 
             self.freeze_with(client)
 
@@ -64,6 +64,11 @@ class Transaction(_Executable):
         # This allows us to maintain the signatures for each unique transaction
         # and ensures that the correct signatures are used when submitting transactions
         self._signature_map: dict[bytes, basic_types_pb2.SignatureMap] = {}
+
+        # Caches the serialized SignedTransaction per body bytes, so retries and batch
+        # assembly reuse it instead of re-serializing. Each entry remembers the signature
+        # map and signature count it was built from and is rebuilt when either changes.
+        self._signed_transaction_bytes: dict[bytes, tuple[basic_types_pb2.SignatureMap | None, int, bytes]] = {}
         # changed from int: 2_000_000 to Hbar: 2
         self._default_transaction_fee = Hbar(2)
         self.operator_account_id = None
@@ -180,26 +185,27 @@ class Transaction(_Executable):
         # We require the transaction to be frozen before signing
         self._require_frozen()
 
+        # The signer is the same for every node body, so derive its prefix once
+        public_key_bytes = private_key.public_key().to_bytes_raw()
+        is_ed25519 = private_key.is_ed25519()
+
         # We sign the bodies for each node in case we need to switch nodes during execution.
         for body_bytes in self._transaction_body_bytes.values():
-            signature = private_key.sign(body_bytes)
+            # We initialize the signature map for this body_bytes if it doesn't exist yet
+            sig_map = self._signature_map.setdefault(body_bytes, basic_types_pb2.SignatureMap())
 
-            public_key_bytes = private_key.public_key().to_bytes_raw()
+            # deduplication check, done before signing so an existing signature is never recomputed
+            if any(sp.pubKeyPrefix == public_key_bytes for sp in sig_map.sigPair):
+                continue
 
-            if private_key.is_ed25519():
+            signature = private_key.sign(body_bytes)
+
+            if is_ed25519:
                 sig_pair = basic_types_pb2.SignaturePair(pubKeyPrefix=public_key_bytes, ed25519=signature)
             else:
                 sig_pair = basic_types_pb2.SignaturePair(pubKeyPrefix=public_key_bytes, ECDSA_secp256k1=signature)
 
-            # We initialize the signature map for this body_bytes if it doesn't exist yet
-            self._signature_map.setdefault(body_bytes, basic_types_pb2.SignatureMap())
-
-            # deduplication check
-            already_signed = any(sp.pubKeyPrefix == public_key_bytes for sp in self._signature_map[body_bytes].sigPair)
-
-            # append only if not already signed
-            if not already_signed:
-                self._signature_map[body_bytes].sigPair.append(sig_pair)
+            sig_map.sigPair.append(sig_pair)
 
         return self
 
@@ -220,14 +226,35 @@ class Transaction(_Executable):
         if body_bytes is None:
             raise ValueError(f"No transaction body found for node {self.node_account_id}")
 
-        # Get signature map, or create empty one if transaction is not signed
+        return transaction_pb2.Transaction(signedTransactionBytes=self._get_signed_transaction_bytes(body_bytes))
+
+    def _get_signed_transaction_bytes(self, body_bytes: bytes) -> bytes:
+        """
+        Returns the serialized SignedTransaction for the given body bytes.
+
+        The result is cached and only rebuilt after the signatures for this body have changed.
+
+        Args:
+            body_bytes (bytes): The frozen transaction body for one node.
+
+        Returns:
+            bytes: The serialized SignedTransaction.
+        """
         sig_map = self._signature_map.get(body_bytes)
-        if sig_map is None:
-            sig_map = basic_types_pb2.SignatureMap()
+        sig_count = len(sig_map.sigPair) if sig_map is not None else 0
+
+        cached = self._signed_transaction_bytes.get(body_bytes)
+        if cached is not None and cached[0] is sig_map and cached[1] == sig_count:
+            return cached[2]
 
-        signed_transaction = transaction_contents_pb2.SignedTransaction(bodyBytes=body_bytes, sigMap=sig_map)
+        # Use an empty signature map if transaction is not signed
+        signed_transaction = transaction_contents_pb2.SignedTransaction(
+            bodyBytes=body_bytes, sigMap=sig_map if sig_map is not None else basic_types_pb2.SignatureMap()
+        )
+        signed_transaction_bytes = signed_transaction.SerializeToString()
 
-        return transaction_pb2.Transaction(signedTransactionBytes=signed_transaction.SerializeToString())
+        self._signed_transaction_bytes[body_bytes] = (sig_map, sig_count, signed_transaction_bytes)
+        return signed_transaction_bytes
 
     def _resolve_transaction_id(self, client: Client):
         if self.transaction_id is not None:
@@ -286,6 +313,9 @@ class Transaction(_Executable):
         if self._transaction_body_bytes:
             return self
 
+        # Serialized transactions built from earlier bodies can no longer be requested
+        self._signed_transaction_bytes.clear()
+
         # Check transaction_id and node id to be set when using freeze()
         self._resolve_transaction_id(client)
 
@@ -309,18 +339,35 @@ class Transaction(_Executable):
 
         # Multiple node
         if len(self.node_account_ids) > 0:
-            for node_account_id in self.node_account_ids:
-                self.node_account_id = node_account_id
-                self._transaction_body_bytes[node_account_id] = self.build_transaction_body().SerializeToString()
+            self._build_body_bytes_for_nodes(self.node_account_ids)
 
         else:
             # Use all nodes from client network
-            for node in client.network.nodes:
-                self.node_account_id = node._account_id
-                self._transaction_body_bytes[node._account_id] = self.build_transaction_body().SerializeToString()
+            self._build_body_bytes_for_nodes([node._account_id for node in client.network.nodes])
 
         return self
 
+    def _build_body_bytes_for_nodes(self, node_account_ids: list[AccountId]) -> None:
+        """
+        Builds and serializes the transaction body for each of the given nodes.
+
+        The bodies only differ in nodeAccountID, so the body is built once and the
+        node field is replaced before each serialization.
+
+        Args:
+            node_account_ids (list[AccountId]): The nodes to build a body for.
+        """
+        if not node_account_ids:
+            return
+
+        self.node_account_id = node_account_ids[0]
+        transaction_body = self.build_transaction_body()
+
+        for node_account_id in node_account_ids:
+            self.node_account_id = node_account_id
+            transaction_body.nodeAccountID.CopyFrom(node_account_id._to_proto())
+            self._transaction_body_bytes[node_account_id] = transaction_body.SerializeToString()
+
     @overload
     def execute(
         self,
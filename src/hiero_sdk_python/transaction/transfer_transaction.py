@@ -5,7 +5,7 @@ from __future__ import annotations
 from hiero_sdk_python.account.account_id import AccountId
 from hiero_sdk_python.channels import _Channel
 from hiero_sdk_python.executable import _Method
-from hiero_sdk_python.hapi.services import basic_types_pb2, crypto_transfer_pb2, transaction_pb2
+from hiero_sdk_python.hapi.services import crypto_transfer_pb2, transaction_pb2
 from hiero_sdk_python.hapi.services.schedulable_transaction_body_pb2 import (
     SchedulableTransactionBody,
 )
@@ -48,24 +48,21 @@ class TransferTransaction(AbstractTokenTransferTransaction["TransferTransaction"
 
     def _init_hbar_transfers(self, hbar_transfers: dict[AccountId, int]) -> None:
         """Initializes HBAR transfers from a dictionary."""
-        for account_id, amount in hbar_transfers.items():
-            self.add_hbar_transfer(account_id, amount)
+        self.add_hbar_transfers(hbar_transfers)
 
-    def _add_hbar_transfer(
-        self, account_id: AccountId, amount: int | Hbar, is_approved: bool = False
-    ) -> TransferTransaction:
+    @staticmethod
+    def _validate_hbar_transfer(account_id: AccountId, amount: int | Hbar, is_approved: bool) -> int:
         """
-        Internal method to add a HBAR transfer to the transaction.
+        Validates a HBAR transfer and returns its amount in tinybars.
 
         Args:
             account_id (AccountId): The account ID of the sender or receiver.
             amount (int | Hbar): The amount of the HBAR to transfer.
-            is_approved (bool, optional): Whether the transfer is approved. Defaults to False.
+            is_approved (bool): Whether the transfer is approved.
 
         Returns:
-            TransferTransaction: The current instance of the transaction for chaining.
+            int: The amount of the transfer in tinybars.
         """
-        self._require_not_frozen()
         if not isinstance(account_id, AccountId):
             raise TypeError("account_id must be an AccountId instance.")
         if isinstance(amount, Hbar):
@@ -74,6 +71,24 @@ class TransferTransaction(AbstractTokenTransferTransaction["TransferTransaction"
             raise TypeError("amount must be an int or Hbar instance.")
         if not isinstance(is_approved, bool):
             raise TypeError("is_approved must be a boolean.")
+        return amount
+
+    def _add_hbar_transfer(
+        self, account_id: AccountId, amount: int | Hbar, is_approved: bool = False
+    ) -> TransferTransaction:
+        """
+        Internal method to add a HBAR transfer to the transaction.
+
+        Args:
+            account_id (AccountId): The account ID of the sender or receiver.
+            amount (int | Hbar): The amount of the HBAR to transfer.
+            is_approved (bool, optional): Whether the transfer is approved. Defaults to False.
+
+        Returns:
+            TransferTransaction: The current instance of the transaction for chaining.
+        """
+        self._require_not_frozen()
+        amount = self._validate_hbar_transfer(account_id, amount, is_approved)
 
         for transfer in self.hbar_transfers:
             if transfer.account_id == account_id:
@@ -83,6 +98,46 @@ class TransferTransaction(AbstractTokenTransferTransaction["TransferTransaction"
         self.hbar_transfers.append(HbarTransfer(account_id, amount, is_approved))
         return self
 
+    def _add_hbar_transfers(
+        self, hbar_transfers: dict[AccountId, int | Hbar], is_approved: bool = False
+    ) -> TransferTransaction:
+        """
+        Internal method to add several HBAR transfers to the transaction in one pass.
+
+        Existing transfers are indexed once, so merging N transfers costs O(N)
+        instead of scanning the transfer list for every account. Every entry is
+        validated before any is applied, so an invalid entry leaves the transaction unchanged.
+
+        Args:
+            hbar_transfers (dict[AccountId, int | Hbar]): The amount to transfer per account.
+            is_approved (bool, optional): Whether the transfers are approved. Defaults to False.
+
+        Returns:
+            TransferTransaction: The current instance of the transaction for chaining.
+        """
+        self._require_not_frozen()
+
+        validated = [
+            (account_id, self._validate_hbar_transfer(account_id, amount, is_approved))
+            for account_id, amount in hbar_transfers.items()
+        ]
+
+        transfers_by_account: dict[AccountId, HbarTransfer] = {}
+        for transfer in self.hbar_transfers:
+            transfers_by_account.setdefault(transfer.account_id, transfer)
+
+        for account_id, amount in validated:
+            transfer = transfers_by_account.get(account_id)
+            if transfer is not None:
+                transfer.amount += amount
+                continue
+
+            transfer = HbarTransfer(account_id, amount, is_approved)
+            self.hbar_transfers.append(transfer)
+            transfers_by_account[account_id] = transfer
+
+        return self
+
     def add_hbar_transfer(self, account_id: AccountId, amount: int | Hbar) -> TransferTransaction:
         """
         Adds a HBAR transfer to the transaction.
@@ -111,23 +166,42 @@ class TransferTransaction(AbstractTokenTransferTransaction["TransferTransaction"
         self._add_hbar_transfer(account_id, amount, True)
         return self
 
+    def add_hbar_transfers(self, hbar_transfers: dict[AccountId, int | Hbar]) -> TransferTransaction:
+        """
+        Adds several HBAR transfers to the transaction.
+
+        Args:
+            hbar_transfers (dict[AccountId, int | Hbar]): The amount to transfer per account.
+
+        Returns:
+            TransferTransaction: The current instance of the transaction for chaining.
+        """
+        return self._add_hbar_transfers(hbar_transfers, False)
+
+    def add_approved_hbar_transfers(self, hbar_transfers: dict[AccountId, int | Hbar]) -> TransferTransaction:
+        """
+        Adds several HBAR transfers with approval to the transaction.
+
+        Args:
+            hbar_transfers (dict[AccountId, int | Hbar]): The amount to transfer per account.
+
+        Returns:
+            TransferTransaction: The current instance of the transaction for chaining.
+        """
+        return self._add_hbar_transfers(hbar_transfers, True)
+
     def _build_proto_body(self) -> crypto_transfer_pb2.CryptoTransferTransactionBody:
         """Returns the protobuf body for the transfer transaction."""
         crypto_transfer_tx_body = crypto_transfer_pb2.CryptoTransferTransactionBody()
 
-        # HBAR
+        # HBAR: fill the body's transfer list in place rather than copying a separate message into it
         if self.hbar_transfers:
-            transfer_list = basic_types_pb2.TransferList()
-            for hbar_transfer in self.hbar_transfers:
-                transfer_list.accountAmounts.append(hbar_transfer._to_proto())
-
-            crypto_transfer_tx_body.transfers.CopyFrom(transfer_list)
+            crypto_transfer_tx_body.transfers.accountAmounts.extend(
+                hbar_transfer._to_proto() for hbar_transfer in self.hbar_transfers
+            )
 
         # NFTs/Tokens
-        token_transfers = self.build_token_transfers()
-
-        for transfer in token_transfers:
-            crypto_transfer_tx_body.tokenTransfers.append(transfer)
+        crypto_transfer_tx_body.tokenTransfers.extend(self.build_token_transfers())
 
         return crypto_transfer_tx_body
 
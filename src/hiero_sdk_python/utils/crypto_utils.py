@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from cryptography.hazmat.primitives import serialization
-from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec, utils as asym_utils
 
 
 try:
@@ -11,6 +11,8 @@ except ImportError:
 
 
 SECP256K1_CURVE = ec.SECP256K1()
+# Signature algorithm for ECDSA over an already Keccak-256 hashed payload, stateless and shared
+ECDSA_PREHASHED_SHA256 = ec.ECDSA(asym_utils.Prehashed(hashes.SHA256()))
 
 
 def keccak256(data: bytes) -> bytes:
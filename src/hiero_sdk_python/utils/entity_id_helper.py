@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import re
 import struct
 from typing import TYPE_CHECKING, Any
@@ -17,6 +18,7 @@ P3 = 26**3
 P5 = 26**5
 
 
+@functools.lru_cache(maxsize=1024)
 def parse_from_string(address: str) -> tuple[str, str, str, str | None]:
     """
     Parse an address string of the form: <shard>.<realm>.<num>[-<checksum>].
@@ -520,6 +520,9 @@ def test_equality(account_id_100, account_id_101):
 
     assert account_id_100 == account_id2
     assert account_id_100 != account_id_101
+    assert account_id_100 == account_id_100
+    assert account_id_100 != AccountId(shard=1, realm=0, num=100)
+    assert account_id_100 != AccountId(shard=0, realm=1, num=100)
 
 
 def test_equality_with_alias_key(alias_key, alias_key2):
@@ -563,6 +566,14 @@ def test_equality_different_types(account_id_100):
     assert account_id_100 is not None
 
 
+def test_account_id_uses_slots(account_id_100):
+    """Test that AccountId stores its fields in slots rather than a per-instance __dict__."""
+    assert not hasattr(account_id_100, "__dict__")
+
+    with pytest.raises(AttributeError):
+        account_id_100.unknown_field = 1
+
+
 def test_hash(account_id_100, account_id_101):
     """Test AccountId hash function."""
     account_id2 = AccountId(shard=0, realm=0, num=100)
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from unittest.mock import MagicMock
+import threading
+import time
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -19,9 +21,10 @@ from hiero_sdk_python.hapi.services.transaction_receipt_pb2 import (
 from hiero_sdk_python.hapi.services.transaction_response_pb2 import (
     TransactionResponse as TransactionResponseProto,
 )
+from hiero_sdk_python.query.transaction_get_receipt_query import TransactionGetReceiptQuery
 from hiero_sdk_python.response_code import ResponseCode
 from hiero_sdk_python.system.freeze_transaction import FreezeTransaction
-from hiero_sdk_python.transaction.batch_transaction import BatchTransaction
+from hiero_sdk_python.transaction.batch_transaction import _MAX_RECEIPT_WORKERS, BatchTransaction
 from hiero_sdk_python.transaction.transaction import Transaction
 from hiero_sdk_python.transaction.transaction_id import TransactionId
 from hiero_sdk_python.transaction.transfer_transaction import TransferTransaction
@@ -227,6 +230,53 @@ def test_get_inner_transactions_ids_returns_transaction_ids(mock_tx):
     assert isinstance(tx_ids[0], TransactionId)
 
 
+def test_get_inner_receipts_returns_receipts_in_inner_order(mock_tx, mock_client):
+    """Test that get_inner_receipts queries every inner transaction and keeps their order."""
+    batch_key = PrivateKey.generate()
+    batch_tx = BatchTransaction().set_inner_transactions([mock_tx(batch_key=batch_key) for _ in range(3)])
+
+    def fake_execute(query, client, timeout=None):
+        return query.transaction_id
+
+    with patch.object(TransactionGetReceiptQuery, "execute", autospec=True, side_effect=fake_execute) as mock_execute:
+        receipts = batch_tx.get_inner_receipts(mock_client)
+
+    assert receipts == batch_tx.get_inner_transaction_ids()
+    assert mock_execute.call_count == 3
+
+
+def test_get_inner_receipts_bounds_concurrent_queries(mock_tx, mock_client):
+    """Test that get_inner_receipts never runs more than _MAX_RECEIPT_WORKERS queries at once."""
+    batch_key = PrivateKey.generate()
+    batch_tx = BatchTransaction().set_inner_transactions(
+        [mock_tx(batch_key=batch_key) for _ in range(_MAX_RECEIPT_WORKERS * 2)]
+    )
+    lock = threading.Lock()
+    running = 0
+    peak = 0
+
+    def fake_execute(query, client, timeout=None):
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.01)
+        with lock:
+            running -= 1
+        return query.transaction_id
+
+    with patch.object(TransactionGetReceiptQuery, "execute", autospec=True, side_effect=fake_execute):
+        receipts = batch_tx.get_inner_receipts(mock_client)
+
+    assert receipts == batch_tx.get_inner_transaction_ids()
+    assert 1 < peak <= _MAX_RECEIPT_WORKERS
+
+
+def test_get_inner_receipts_without_inner_transactions(mock_client):
+    """Test that get_inner_receipts returns an empty list for an empty batch."""
+    assert BatchTransaction().get_inner_receipts(mock_client) == []
+
+
 def test_build_batch_transaction_body(mock_account_ids, mock_client):
     """Test building a batch transaction body with valid parameters."""
     sender_id, receiver_id, node_id, _, _ = mock_account_ids
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+
+from hiero_sdk_python.account.account_id import AccountId
+from hiero_sdk_python.channels import _Channel, _ChannelPool
+from hiero_sdk_python.node import _Node
+
+
+pytestmark = pytest.mark.unit
+
+
+def test_acquire_creates_channel_once_per_key():
+    """Test that the factory runs only for the first acquire of a key."""
+    pool = _ChannelPool()
+    factory = Mock(side_effect=lambda: _Channel(Mock()))
+
+    channel1 = pool.acquire("node-a", factory)
+    channel2 = pool.acquire("node-a", factory)
+
+    assert channel1 is channel2
+    assert factory.call_count == 1
+
+
+def test_acquire_separates_keys():
+    """Test that different keys get different channels."""
+    pool = _ChannelPool()
+
+    channel1 = pool.acquire("node-a", lambda: _Channel(Mock()))
+    channel2 = pool.acquire("node-b", lambda: _Channel(Mock()))
+
+    assert channel1 is not channel2
+
+
+def test_release_closes_channel_after_last_reference():
+    """Test that the channel stays open until every holder has released it."""
+    pool = _ChannelPool()
+    channel = pool.acquire("node-a", lambda: _Channel(Mock()))
+    pool.acquire("node-a", lambda: _Channel(Mock()))
+
+    pool.release("node-a")
+    channel.channel.close.assert_not_called()
+
+    pool.release("node-a")
+    channel.channel.close.assert_called_once()
+
+    # A new acquire after the last release opens a fresh channel
+    assert pool.acquire("node-a", lambda: _Channel(Mock())) is not channel
+
+
+def test_factory_runs_without_holding_the_pool_lock():
+    """Test that a slow factory for one key does not block acquiring another key."""
+    pool = _ChannelPool()
+    factory_started = threading.Event()
+    other_key_acquired = threading.Event()
+    results = {}
+
+    def slow_factory():
+        factory_started.set()
+        results["other_acquired_first"] = other_key_acquired.wait(timeout=5)
+        return _Channel(Mock())
+
+    worker = threading.Thread(target=pool.acquire, args=("slow-node", slow_factory))
+    worker.start()
+    assert factory_started.wait(timeout=5)
+
+    pool.acquire("fast-node", lambda: _Channel(Mock()))
+    other_key_acquired.set()
+    worker.join(timeout=5)
+
+    assert results["other_acquired_first"] is True
+
+
+def test_acquire_keeps_first_pooled_channel_when_creation_races():
+    """Test that a channel created while another was pooled for the key is closed and not used."""
+    pool = _ChannelPool()
+    winner = _Channel(Mock())
+    loser = _Channel(Mock())
+
+    def racing_factory():
+        # Another caller pools a channel for the same key while this one is being created
+        assert pool.acquire("node-a", lambda: winner) is winner
+        return loser
+
+    assert pool.acquire("node-a", racing_factory) is winner
+    loser.channel.close.assert_called_once()
+    winner.channel.close.assert_not_called()
+
+    # Both callers hold a reference to the winning channel
+    pool.release("node-a")
+    winner.channel.close.assert_not_called()
+    pool.release("node-a")
+    winner.channel.close.assert_called_once()
+
+
+def test_release_unknown_key_is_noop():
+    """Test that releasing a key that was never acquired does nothing."""
+    pool = _ChannelPool()
+    pool.release("missing")
+
+
+def test_clear_closes_all_channels():
+    """Test that clear closes every pooled channel."""
+    pool = _ChannelPool()
+    channel1 = pool.acquire("node-a", lambda: _Channel(Mock()))
+    channel2 = pool.acquire("node-b", lambda: _Channel(Mock()))
+
+    pool.clear()
+
+    channel1.channel.close.assert_called_once()
+    channel2.channel.close.assert_called_once()
+
+
+@patch("grpc.insecure_channel")
+def test_nodes_with_same_endpoint_share_channel(mock_insecure):
+    """Test that nodes of different networks targeting one endpoint reuse a single channel."""
+    node1 = _Node(AccountId(0, 0, 3), "127.0.0.1:50211", None)
+    node2 = _Node(AccountId(0, 0, 3), "127.0.0.1:50211", None)
+
+    channel1 = node1._get_channel()
+    channel2 = node2._get_channel()
+
+    assert channel1 is channel2
+    assert mock_insecure.call_count == 1
+
+    node1._close()
+    assert node1._channel is None
+    mock_insecure.return_value.close.assert_not_called()
+
+    node2._close()
+    mock_insecure.return_value.close.assert_called_once()
+
+
+@patch("grpc.insecure_channel")
+def test_nodes_with_different_endpoints_do_not_share_channel(mock_insecure):
+    """Test that nodes at different endpoints get their own channels."""
+    node1 = _Node(AccountId(0, 0, 3), "127.0.0.1:50211", None)
+    node2 = _Node(AccountId(0, 0, 4), "127.0.0.2:50211", None)
+
+    assert node1._get_channel() is not node2._get_channel()
+    assert mock_insecure.call_count == 2
+
+
+@patch("grpc.secure_channel")
+def test_node_with_pooled_tls_channel_gets_certificate(mock_secure):
+    """Test that a node reusing a pooled TLS channel takes the certificate it was secured with."""
+    node1 = _Node(AccountId(0, 0, 3), "127.0.0.1:50212", None)
+    node2 = _Node(AccountId(0, 0, 3), "127.0.0.1:50212", None)
+    for node in (node1, node2):
+        node._verify_certificates = False
+
+    with patch.object(_Node, "_fetch_server_certificate_pem", return_value=b"pem-cert") as mock_fetch:
+        assert node1._get_channel() is node2._get_channel()
+
+    assert mock_fetch.call_count == 1
+    assert node2._node_pem_cert == b"pem-cert"
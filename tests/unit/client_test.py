@@ -4,15 +4,16 @@ Unit tests for Client methods (eg. from_env, for_testnet, for_mainnet, for_previ
 
 from __future__ import annotations
 
+import asyncio
 import os
 from decimal import Decimal
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 import pytest
 
 from hiero_sdk_python import AccountId, Client
 from hiero_sdk_python.client import client as client_module
-from hiero_sdk_python.client.network import Network
+from hiero_sdk_python.client.network import Network, _clear_mirror_node_cache
 from hiero_sdk_python.crypto.private_key import PrivateKey
 from hiero_sdk_python.hbar import Hbar
 from hiero_sdk_python.node import _Node
@@ -74,6 +75,49 @@ def test_for_mainnet_then_set_operator():
     client.close()
 
 
+def test_from_env_loads_dotenv_once(tmp_path):
+    """Test that repeated from_env calls only read an unchanged .env file once."""
+    client_module._load_dotenv_file.cache_clear()
+    dotenv_path = tmp_path / ".env"
+    dotenv_path.write_text("NETWORK=solo\n")
+    dummy_key = PrivateKey.generate_ed25519().to_string_der()
+    env_vars = {"OPERATOR_ID": "0.0.1234", "OPERATOR_KEY": dummy_key}
+
+    with (
+        patch.object(client_module, "find_dotenv", return_value=str(dotenv_path)),
+        patch.object(client_module, "load_dotenv") as mock_load_dotenv,
+        patch.dict(os.environ, env_vars, clear=True),
+    ):
+        Client.from_env("solo").close()
+        Client.from_env("solo").close()
+
+    mock_load_dotenv.assert_called_once_with(str(dotenv_path))
+    client_module._load_dotenv_file.cache_clear()
+
+
+def test_from_env_reloads_modified_dotenv(tmp_path):
+    """Test that a .env file is read again after it has been modified."""
+    client_module._load_dotenv_file.cache_clear()
+    dotenv_path = tmp_path / ".env"
+    dotenv_path.write_text("OPERATOR_ID=0.0.1234\n")
+
+    with (
+        patch.object(client_module, "find_dotenv", return_value=str(dotenv_path)),
+        patch.dict(os.environ, {}, clear=True),
+    ):
+        client_module._load_dotenv()
+        assert os.environ["OPERATOR_ID"] == "0.0.1234"
+        assert "NETWORK" not in os.environ
+
+        dotenv_path.write_text("OPERATOR_ID=0.0.1234\nNETWORK=solo\n")
+        stat = dotenv_path.stat()
+        os.utime(dotenv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        client_module._load_dotenv()
+        assert os.environ["NETWORK"] == "solo"
+
+    client_module._load_dotenv_file.cache_clear()
+
+
 def test_from_env_missing_operator_id_raises_error():
     """Test that from_env raises ValueError when OPERATOR_ID is missing."""
     dummy_key = PrivateKey.generate_ed25519().to_string_der()
@@ -458,12 +502,78 @@ def test_update_network_refreshes_nodes_and_returns_self():
     with patch.object(client.network, "_set_network_nodes") as mock_set_nodes:
         returned = client.update_network()
 
-        mock_set_nodes.assert_called_once()
+        mock_set_nodes.assert_called_once_with(refresh=True)
         assert returned is client
 
     client.close()
 
 
+def test_update_network_refetches_changed_address_book():
+    """Test that update_network bypasses the cached address book and picks up new nodes."""
+
+    def mirror_node(account_num):
+        return {
+            "node_account_id": f"0.0.{account_num}",
+            "node_id": account_num - 3,
+            "node_cert_hash": "0x",
+            "service_endpoints": [{"ip_address_v4": "127.0.0.1", "port": 50211 + account_num, "domain_name": ""}],
+        }
+
+    first_response = Mock()
+    first_response.json.return_value = {"nodes": [mirror_node(3)]}
+    second_response = Mock()
+    second_response.json.return_value = {"nodes": [mirror_node(3), mirror_node(4)]}
+
+    _clear_mirror_node_cache()
+    try:
+        with patch(
+            "hiero_sdk_python.client.network.requests.get",
+            side_effect=[first_response, second_response],
+        ) as mock_get:
+            client = Client(Network("testnet"))
+            assert len(client.network.nodes) == 1
+
+            client.update_network()
+
+        assert mock_get.call_count == 2
+        assert [str(node._account_id) for node in client.network.nodes] == ["0.0.3", "0.0.4"]
+        client.close()
+    finally:
+        _clear_mirror_node_cache()
+
+
+def test_new_network_refetches_after_empty_address_book():
+    """Test that an empty mirror node response is not reused by the next Network."""
+
+    def mirror_node(account_num):
+        return {
+            "node_account_id": f"0.0.{account_num}",
+            "node_id": account_num - 3,
+            "node_cert_hash": "0x",
+            "service_endpoints": [{"ip_address_v4": "127.0.0.1", "port": 50211 + account_num, "domain_name": ""}],
+        }
+
+    empty_response = Mock()
+    empty_response.json.return_value = {"nodes": []}
+    response = Mock()
+    response.json.return_value = {"nodes": [mirror_node(3)]}
+
+    _clear_mirror_node_cache()
+    try:
+        with patch(
+            "hiero_sdk_python.client.network.requests.get",
+            side_effect=[empty_response, response],
+        ) as mock_get:
+            first = Network("testnet")
+            second = Network("testnet")
+
+        assert mock_get.call_count == 2
+        assert len(first.nodes) == len(Network.DEFAULT_NODES["testnet"])
+        assert [str(node._account_id) for node in second.nodes] == ["0.0.3"]
+    finally:
+        _clear_mirror_node_cache()
+
+
 def test_warning_when_grpc_deadline_exceeds_request_timeout():
     """Warn when grpc_deadline is greater than request_timeout."""
     client = Client.for_testnet()
@@ -604,3 +714,39 @@ def test_for_network_invalid_shard_realm_raises_error(invalid_map, error_msg):
     """Test that for_network catches mismatched shards or realms."""
     with pytest.raises(ValueError, match=error_msg):
         Client.for_network(invalid_map)
+
+
+def test_with_operator_shares_network_and_settings():
+    """Test that with_operator returns a client for a new operator on the same network."""
+    client = Client.for_network({"127.0.0.1:50211": AccountId(0, 0, 3)})
+    client.set_operator(AccountId(0, 0, 1001), PrivateKey.generate_ed25519())
+    client.set_max_attempts(3)
+
+    spender_id = AccountId(0, 0, 1002)
+    spender_key = PrivateKey.generate_ed25519()
+    spender_client = client.with_operator(spender_id, spender_key)
+
+    assert spender_client is not client
+    assert spender_client.network is client.network
+    assert spender_client.max_attempts == 3
+    assert spender_client.operator_account_id == spender_id
+    assert spender_client.operator_private_key is spender_key
+
+    # The original client keeps its own operator
+    assert client.operator_account_id == AccountId(0, 0, 1001)
+
+    client.close()
+
+
+def test_async_context_manager_closes_client():
+    """Test that leaving an 'async with' block closes the client."""
+    client = Client.for_testnet()
+
+    async def use_client():
+        async with client as entered:
+            assert entered is client
+
+    with patch.object(client, "close") as mock_close:
+        asyncio.run(use_client())
+
+    mock_close.assert_called_once()
@@ -6,6 +6,7 @@ import pytest
 
 from hiero_sdk_python.account.account_id import AccountId
 from hiero_sdk_python.address_book.node_address import NodeAddress
+from hiero_sdk_python.channels import _CHANNEL_POOL
 from hiero_sdk_python.client.client import Client
 from hiero_sdk_python.client.network import Network
 from hiero_sdk_python.consensus.topic_id import TopicId
@@ -26,6 +27,13 @@ MIIBszCCAVmgAwIBAgIUQFakeFakeFakeFakeFakeFakeFakewCgYIKoZIzj0EAwIw
 FAKE_CERT_HASH = hashlib.sha384(FAKE_CERT_PEM).hexdigest().encode("utf-8")
 
 
+@pytest.fixture(autouse=True)
+def clear_channel_pool():
+    """Close pooled channels after each test so channels never leak between tests."""
+    yield
+    _CHANNEL_POOL.clear()
+
+
 @pytest.fixture
 def mock_account_ids():
     """Fixture to provide mock account IDs and token IDs."""
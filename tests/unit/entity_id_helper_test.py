@@ -230,3 +230,15 @@ def test_perform_query_to_mirror_node_invalid_url_empty():
     """Test url must be a non-empty string (empty string case)."""
     with pytest.raises(ValueError, match="url must be a non-empty string"):
         perform_query_to_mirror_node("")
+
+
+def test_parse_from_string_caches_results():
+    """Test that parsing the same entity ID string twice reuses the cached result."""
+    parse_from_string.cache_clear()
+
+    first = parse_from_string("0.0.123-abcde")
+    second = parse_from_string("0.0.123-abcde")
+
+    assert first == ("0", "0", "123", "abcde")
+    assert second is first
+    assert parse_from_string.cache_info().hits == 1
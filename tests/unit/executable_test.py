@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+import threading
 from itertools import chain, repeat
 from unittest.mock import patch
 
@@ -1148,3 +1150,73 @@ def test_retry_invalid_node_account_updates_network():
         mock_increase_backoff.assert_called_once()
         mock_update_network.assert_called_once()
         mock_delay.assert_called_once()
+
+
+def test_unhealthy_node_receipt_request_backs_off_exponentially(mock_client):
+    """Receipt polling against an unhealthy node should back off exponentially up to the receipt polling cap."""
+    tx = TransactionGetReceiptQuery().set_transaction_id(TransactionId.from_string("0.0.3@1769674705.770340600"))
+    mock_client.max_attempts = 4
+
+    with (
+        patch("hiero_sdk_python.node._Node.is_healthy", return_value=False),
+        patch("hiero_sdk_python.executable._delay_for_attempt") as mock_delay,
+        pytest.raises(MaxAttemptsError),
+    ):
+        tx.execute(mock_client)
+
+    delays = [call_args[0][1] for call_args in mock_delay.call_args_list]
+    assert delays == [0.5, 1.0, 2.0, 2.0]
+
+
+def test_calculate_delay_is_clipped_to_request_timeout():
+    """The retry delay should never run past the remaining request timeout."""
+    tx = AccountCreateTransaction()
+    tx._min_backoff = 0.25
+    tx._max_backoff = 8
+    tx._request_timeout = 10
+
+    with patch("hiero_sdk_python.executable.time.monotonic", return_value=107.0):
+        assert tx._calculate_delay(0, start=100.0) == 0.5
+        assert tx._calculate_delay(10, start=100.0) == 3.0
+        assert tx._calculate_delay(10, start=90.0) == 0.0
+
+
+def test_execute_async_returns_execute_result():
+    """execute_async should run the query against the network and return the same result as execute."""
+    ok_response = response_pb2.Response(
+        cryptogetAccountBalance=crypto_get_account_balance_pb2.CryptoGetAccountBalanceResponse(
+            header=response_header_pb2.ResponseHeader(nodeTransactionPrecheckCode=ResponseCode.OK),
+            balance=100000000,
+        )
+    )
+
+    with mock_hedera_servers([[ok_response]]) as client:
+        query = CryptoGetAccountBalanceQuery().set_account_id(AccountId(0, 0, 1234))
+
+        balance = asyncio.run(query.execute_async(client))
+
+    assert balance.hbars.to_tinybars() == 100000000
+
+
+def test_execute_async_forwards_arguments_to_worker_thread(mock_client):
+    """execute_async should forward its arguments to execute and run it off the event loop thread."""
+    tx = AccountCreateTransaction()
+    loop_thread = threading.get_ident()
+    calls = []
+
+    def fake_execute(client, *args, **kwargs):
+        calls.append((client, args, kwargs, threading.get_ident()))
+        return "receipt"
+
+    async def run_both():
+        return await asyncio.gather(
+            tx.execute_async(mock_client, 5, wait_for_receipt=False),
+            tx.execute_async(mock_client),
+        )
+
+    with patch.object(tx, "execute", side_effect=fake_execute):
+        results = asyncio.run(run_both())
+
+    assert results == ["receipt", "receipt"]
+    assert (mock_client, (5,), {"wait_for_receipt": False}) in [call[:3] for call in calls]
+    assert all(call[3] != loop_thread for call in calls)
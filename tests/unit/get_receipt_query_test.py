@@ -16,6 +16,7 @@ from hiero_sdk_python.hapi.services import (
     transaction_receipt_pb2,
 )
 from hiero_sdk_python.query.transaction_get_receipt_query import (
+    RECEIPT_MAX_BACKOFF,
     TransactionGetReceiptQuery,
 )
 from hiero_sdk_python.response_code import ResponseCode
@@ -468,3 +469,23 @@ def test_account_id_returns_none_when_not_set(transaction_id):
 
         # Verify: account_id is None when accountID is not set in protobuf
         assert result.account_id is None
+
+
+def test_receipt_polling_backoff_is_capped():
+    """Test that receipt polling backs off exponentially but never waits longer than RECEIPT_MAX_BACKOFF."""
+    query = TransactionGetReceiptQuery()
+    query._min_backoff = 0.25
+    query._max_backoff = 8
+
+    delays = [query._calculate_backoff(attempt) for attempt in range(5)]
+
+    assert delays == [0.5, 1.0, RECEIPT_MAX_BACKOFF, RECEIPT_MAX_BACKOFF, RECEIPT_MAX_BACKOFF]
+
+
+def test_receipt_polling_backoff_respects_configured_range():
+    """Test that the receipt polling cap never goes below the configured minimum or above the maximum backoff."""
+    slow_query = TransactionGetReceiptQuery().set_min_backoff(5).set_max_backoff(10)
+    assert [slow_query._calculate_backoff(attempt) for attempt in range(3)] == [5, 5, 5]
+
+    fast_query = TransactionGetReceiptQuery().set_min_backoff(0.25).set_max_backoff(1)
+    assert [fast_query._calculate_backoff(attempt) for attempt in range(3)] == [0.5, 1, 1]
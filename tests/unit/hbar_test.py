@@ -123,6 +123,14 @@ def test_to_tinybars_preserves_large_integer_values():
     assert hbar.to_tinybars() == tinybars
 
 
+def test_constructor_with_large_integer_amount_is_exact():
+    """Integer amounts convert to tinybars exactly, even beyond the float-safe range."""
+    hbar = Hbar(90_071_992_547_409_930, unit=HbarUnit.GIGABAR)
+
+    assert hbar.to_tinybars() == 90_071_992_547_409_930 * 100_000_000_000_000_000
+    assert isinstance(hbar.to_tinybars(), int)
+
+
 def test_from_string_preserves_large_integer_hbar_values():
     """Parsing large whole hbar values should preserve the exact tinybar amount."""
     hbar_amount = "90071992.54740993"
@@ -154,6 +162,22 @@ def test_from_string_invalid(invalid_str):
         Hbar.from_string(invalid_str)
 
 
+@pytest.mark.parametrize("tinybar_str", ["10 tℏ", "5000 tℏ", "-3 tℏ", "1.5 tℏ"])
+def test_from_string_tinybar_amounts_rejected(tinybar_str):
+    """Test that string amounts in tinybars are parsed as Decimal and rejected like other non-int tinybars."""
+    with pytest.raises(ValueError, match="Fractional tinybar value not allowed"):
+        Hbar.from_string(tinybar_str)
+
+
+def test_unit_from_string():
+    """Test that every unit symbol resolves to its HbarUnit and unknown symbols are rejected."""
+    for unit in HbarUnit:
+        assert HbarUnit.from_string(unit.symbol) is unit
+
+    with pytest.raises(ValueError, match="Invalid Hbar unit symbol: uℏ"):
+        HbarUnit.from_string("uℏ")
+
+
 def test_creation_using_of_method():
     """Test creation of HBAR using of method"""
     assert Hbar.of(50, HbarUnit.TINYBAR).to_tinybars() == 50
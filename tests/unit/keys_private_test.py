@@ -409,6 +409,38 @@ def test_public_key_roundtrip_der_and_raw():
     assert pub2.to_string_ecdsa() == pub.to_string_ecdsa()
 
 
+@pytest.mark.parametrize("key_type", ["ed25519", "ecdsa"])
+def test_public_key_is_derived_once(key_type):
+    """Test that public_key() returns the same cached PublicKey on every call."""
+    priv = PrivateKey.generate(key_type)
+
+    pub = priv.public_key()
+
+    assert priv.public_key() is pub
+    assert pub.to_bytes_raw() == PublicKey(priv._private_key.public_key()).to_bytes_raw()
+
+
+def test_from_string_returns_new_key_each_call():
+    """Test that loading the same key string twice does not share a PrivateKey instance."""
+    key_str = PrivateKey.generate_ed25519().to_string_der()
+
+    key = PrivateKey.from_string(key_str)
+
+    assert PrivateKey.from_string(key_str) is not key
+    assert key.to_string_der() == key_str
+
+
+@pytest.mark.parametrize("key_type", ["ed25519", "ecdsa"])
+def test_to_bytes_raw_is_cached(key_type):
+    """Test that to_bytes_raw() serializes the key once and to_string() reuses it."""
+    priv = PrivateKey.generate(key_type)
+
+    raw = priv.to_bytes_raw()
+
+    assert priv.to_bytes_raw() is raw
+    assert priv.to_string() == raw.hex()
+
+
 @pytest.mark.parametrize("key_type", ["ed25519", "ecdsa"])
 def test_repr_contains_full_hex(key_type):
     """
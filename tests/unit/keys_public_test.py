@@ -36,6 +36,38 @@ def ecdsa_keypair():
     return private, public
 
 
+# ------------------------------------------------------------------------------
+# Test: to_bytes_raw caching
+# ------------------------------------------------------------------------------
+def test_to_bytes_raw_is_cached(ed25519_keypair, ecdsa_keypair):
+    """to_bytes_raw serializes once and keeps returning the same compressed bytes."""
+    for _, public in (ed25519_keypair, ecdsa_keypair):
+        pubkey = PublicKey(public)
+
+        raw = pubkey.to_bytes_raw()
+
+        assert pubkey.to_bytes_raw() is raw
+        if pubkey.is_ed25519():
+            assert raw == pubkey.to_bytes_ed25519()
+        else:
+            assert raw == pubkey.to_bytes_ecdsa(compressed=True)
+            assert len(raw) == 33
+
+
+def test_to_bytes_der_is_cached(ed25519_keypair, ecdsa_keypair):
+    """to_bytes_der serializes once and keeps returning the same SubjectPublicKeyInfo bytes."""
+    for _, public in (ed25519_keypair, ecdsa_keypair):
+        pubkey = PublicKey(public)
+
+        der = pubkey.to_bytes_der()
+
+        assert pubkey.to_bytes_der() is der
+        assert der == public.public_bytes(
+            encoding=serialization.Encoding.DER, format=serialization.PublicFormat.SubjectPublicKeyInfo
+        )
+        assert pubkey.to_string_der() == der.hex()
+
+
 # ------------------------------------------------------------------------------
 # Test: from_bytes_ed25519
 # ------------------------------------------------------------------------------
@@ -398,6 +430,14 @@ def test_to_bytes_der_ecdsa_compressed_structure_and_roundtrip(ecdsa_keypair):
     assert loaded.to_bytes_ecdsa(compressed=True) == compressed_point
 
 
+def test_to_bytes_ed25519_rejects_ecdsa(ecdsa_keypair):
+    _, pub = ecdsa_keypair
+    public_key = PublicKey(pub)
+
+    with pytest.raises(ValueError, match="Not an Ed25519 key"):
+        public_key.to_bytes_ed25519()
+
+
 def test_to_bytes_der_ecdsa_compressed_rejects_ed25519(ed25519_keypair):
     _, pub = ed25519_keypair
     public_key = PublicKey(pub)
@@ -717,6 +757,26 @@ def test_to_evm_address_with_same_ecdsa_key(ecdsa_keypair):
     assert evm_addr1 == evm_addr2
 
 
+def test_to_evm_address_hashes_once(ecdsa_keypair, monkeypatch):
+    """Test that the Keccak derivation runs once and each call returns an independent EvmAddress."""
+    _, pub = ecdsa_keypair
+    public_key = PublicKey(pub)
+    calls = []
+
+    def counting_keccak256(data):
+        calls.append(data)
+        return keccak256(data)
+
+    monkeypatch.setattr("hiero_sdk_python.crypto.public_key.keccak256", counting_keccak256)
+
+    evm_addr1 = public_key.to_evm_address()
+    evm_addr2 = public_key.to_evm_address()
+
+    assert len(calls) == 1
+    assert evm_addr1 == evm_addr2
+    assert evm_addr1 is not evm_addr2
+
+
 def test_to_evm_address_raises_for_ed25519(ed25519_keypair):
     """Ensure ValueError is raised when deriving EVM address from Ed25519 key."""
     _, pub = ed25519_keypair
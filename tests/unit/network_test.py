@@ -5,10 +5,11 @@ from unittest.mock import Mock, patch
 
 import grpc
 import pytest
+import requests
 
 from hiero_sdk_python.account.account_id import AccountId
 from hiero_sdk_python.address_book.node_address import NodeAddress
-from hiero_sdk_python.client.network import Network
+from hiero_sdk_python.client.network import Network, _clear_mirror_node_cache, _fetch_mirror_node_addresses
 from hiero_sdk_python.node import _Node
 
 
@@ -593,3 +594,75 @@ def test_mirror_address_setter_validation_value_error(address):
 
     with pytest.raises(ValueError, match="mirror_address cannot be empty"):
         network.mirror_address = address
+
+
+def test_fetch_mirror_node_addresses_is_cached_per_url():
+    """Test that the mirror node address book is fetched once per URL."""
+    _clear_mirror_node_cache()
+    response = Mock()
+    response.json.return_value = {"nodes": [{"node_id": 0}]}
+
+    with patch("hiero_sdk_python.client.network.requests.get", return_value=response) as mock_get:
+        first = _fetch_mirror_node_addresses("https://mirror.example/api/v1/network/nodes")
+        second = _fetch_mirror_node_addresses("https://mirror.example/api/v1/network/nodes")
+
+    assert first == second == ({"node_id": 0},)
+    assert mock_get.call_count == 1
+    _clear_mirror_node_cache()
+
+
+def test_fetch_mirror_node_addresses_does_not_cache_errors():
+    """Test that a failed mirror node request is retried on the next call."""
+    _clear_mirror_node_cache()
+    response = Mock()
+    response.json.return_value = {"nodes": [{"node_id": 0}]}
+
+    with patch(
+        "hiero_sdk_python.client.network.requests.get",
+        side_effect=[requests.ConnectionError("down"), response],
+    ) as mock_get:
+        with pytest.raises(requests.ConnectionError):
+            _fetch_mirror_node_addresses("https://mirror.example/api/v1/network/nodes")
+        assert _fetch_mirror_node_addresses("https://mirror.example/api/v1/network/nodes") == ({"node_id": 0},)
+
+    assert mock_get.call_count == 2
+    _clear_mirror_node_cache()
+
+
+def test_fetch_mirror_node_addresses_does_not_cache_empty_results():
+    """Test that an empty address book is not cached and the next call queries again."""
+    _clear_mirror_node_cache()
+    empty_response = Mock()
+    empty_response.json.return_value = {"nodes": []}
+    response = Mock()
+    response.json.return_value = {"nodes": [{"node_id": 0}]}
+
+    with patch(
+        "hiero_sdk_python.client.network.requests.get",
+        side_effect=[empty_response, response],
+    ) as mock_get:
+        assert _fetch_mirror_node_addresses("https://mirror.example/api/v1/network/nodes") == ()
+        assert _fetch_mirror_node_addresses("https://mirror.example/api/v1/network/nodes") == ({"node_id": 0},)
+
+    assert mock_get.call_count == 2
+    _clear_mirror_node_cache()
+
+
+def test_fetch_mirror_node_addresses_cache_expires():
+    """Test that a cached address book is fetched again once the TTL has passed."""
+    _clear_mirror_node_cache()
+    response = Mock()
+    response.json.return_value = {"nodes": [{"node_id": 0}]}
+
+    with (
+        patch("hiero_sdk_python.client.network.requests.get", return_value=response) as mock_get,
+        patch("hiero_sdk_python.client.network.time.monotonic", side_effect=[1000.0, 1001.0, 1400.0, 1400.0]),
+    ):
+        _fetch_mirror_node_addresses("https://mirror.example/api/v1/network/nodes")
+        _fetch_mirror_node_addresses("https://mirror.example/api/v1/network/nodes")
+        assert mock_get.call_count == 1
+
+        _fetch_mirror_node_addresses("https://mirror.example/api/v1/network/nodes")
+        assert mock_get.call_count == 2
+
+    _clear_mirror_node_cache()
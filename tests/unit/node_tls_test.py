@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import hashlib
 import ssl
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
@@ -292,6 +294,25 @@ def test_node_get_channel_reuses_existing(mock_insecure, mock_secure, mock_node_
         assert channel1 is channel2
 
 
+@patch("grpc.secure_channel")
+@patch("grpc.insecure_channel")
+def test_node_get_channel_concurrent_calls_share_channel(mock_insecure, mock_secure, mock_node_without_address_book):  # noqa: ARG001
+    """Test that concurrent callers on a fresh node create only one channel."""
+    node = mock_node_without_address_book
+    workers = 8
+    barrier = threading.Barrier(workers)
+
+    def get_channel():
+        barrier.wait()
+        return node._get_channel()
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        channels = list(executor.map(lambda _: get_channel(), range(workers)))
+
+    assert mock_insecure.call_count == 1
+    assert all(channel is channels[0] for channel in channels)
+
+
 def test_node_set_root_certificates(mock_node_with_address_book):
     """Test setting root certificates on node."""
     node = mock_node_with_address_book
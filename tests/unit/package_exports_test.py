@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import ast
+import os
+import subprocess
+import sys
+
+import pytest
+
+import hiero_sdk_python
+
+
+pytestmark = pytest.mark.unit
+
+
+def test_every_export_resolves():
+    """Test that each name in __all__ resolves to an object on the package."""
+    for name in hiero_sdk_python.__all__:
+        assert getattr(hiero_sdk_python, name) is not None
+
+
+def test_lazy_imports_match_all():
+    """Test that the lazy import table covers exactly the public exports."""
+    assert set(hiero_sdk_python._LAZY_IMPORTS) | {"Duration"} == set(hiero_sdk_python.__all__)
+
+
+def test_type_checking_imports_match_lazy_imports():
+    """Test that the TYPE_CHECKING imports name the same modules as the lazy import table."""
+    with open(hiero_sdk_python.__file__, encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+
+    type_checking_block = next(
+        node for node in tree.body if isinstance(node, ast.If) and ast.unparse(node.test) == "TYPE_CHECKING"
+    )
+    type_checking_imports = {
+        alias.name: "." * node.level + (node.module or "")
+        for node in type_checking_block.body
+        if isinstance(node, ast.ImportFrom)
+        for alias in node.names
+    }
+
+    assert type_checking_imports == hiero_sdk_python._LAZY_IMPORTS
+
+
+def test_unknown_attribute_raises():
+    """Test that unknown names still raise AttributeError."""
+    with pytest.raises(AttributeError):
+        _ = hiero_sdk_python.DoesNotExist
+
+
+def test_package_import_defers_submodules():
+    """Test that importing the package does not load transaction modules until they are used."""
+    code = (
+        "import sys, hiero_sdk_python\n"
+        "assert 'hiero_sdk_python.tokens.token_create_transaction' not in sys.modules\n"
+        "hiero_sdk_python.TokenCreateTransaction\n"
+        "assert 'hiero_sdk_python.tokens.token_create_transaction' in sys.modules\n"
+    )
+    src_dir = os.path.dirname(os.path.dirname(hiero_sdk_python.__file__))
+    env = {**os.environ, "PYTHONPATH": src_dir}
+    subprocess.run([sys.executable, "-c", code], check=True, env=env)
@@ -10,6 +10,7 @@ import pytest
 from hiero_sdk_python.account.account_id import AccountId
 from hiero_sdk_python.client.client import Client
 from hiero_sdk_python.consensus.topic_id import TopicId
+from hiero_sdk_python.consensus.topic_message import TopicMessage
 from hiero_sdk_python.hapi.mirror import consensus_service_pb2 as mirror_proto
 from hiero_sdk_python.hapi.services import timestamp_pb2 as hapi_timestamp_pb2
 from hiero_sdk_python.hapi.services.consensus_submit_message_pb2 import ConsensusMessageChunkInfo
@@ -306,6 +307,25 @@ def test_chunk_message_handling(mock_client):
     assert b"chunk-2" in received_messages[0].contents
 
 
+def test_of_many_reassembles_chunks_in_order():
+    """Test that chunks are concatenated by chunk number regardless of arrival order."""
+    chunks = [
+        mirror_proto.ConsensusTopicResponse(
+            message=message,
+            sequenceNumber=number,
+            chunkInfo=ConsensusMessageChunkInfo(total=3, number=number),
+        )
+        for number, message in ((2, b"middle-"), (3, b"end"), (1, b"start-"))
+    ]
+
+    topic_message = TopicMessage.of_many(chunks)
+
+    assert topic_message.contents == b"start-middle-end"
+    assert isinstance(topic_message.contents, bytes)
+    assert topic_message.sequence_number == 3
+    assert len(topic_message.chunks) == 3
+
+
 def test_chunk_message_handling_when_chunking_is_disabled(mock_client):
     """Test that when chunking is disabled only single chunk is released as a single message."""
     query = TopicMessageQuery(topic_id="0.0.123", chunking_enabled=False)
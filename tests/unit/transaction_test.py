@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from unittest.mock import patch
+
 import pytest
 
 from hiero_sdk_python.account.account_create_transaction import AccountCreateTransaction
@@ -14,6 +16,7 @@ from hiero_sdk_python.hapi.services import (
     basic_types_pb2,
     response_header_pb2,
     response_pb2,
+    transaction_contents_pb2,
     transaction_get_receipt_pb2,
     transaction_pb2,
     transaction_receipt_pb2,
@@ -187,6 +190,117 @@ def test_multiple_keys_still_work():
     assert pubkey_prefixes == expected_prefixes, "Signatures should match key1 and key2 exactly"
 
 
+def test_signed_transaction_bytes_reused_until_signed_again():
+    """Test the serialized signed transaction is reused across requests and rebuilt after a new signature."""
+    tx = TokenMintTransaction()
+    tx.set_transaction_id(TransactionId.generate(AccountId(0, 0, 1234)))
+    tx.set_node_account_id(AccountId(0, 0, 3))
+    tx.set_token_id(TokenId(0, 0, 1))
+    tx.set_amount(100)
+    tx.freeze()
+    body_bytes = tx._transaction_body_bytes[AccountId(0, 0, 3)]
+
+    unsigned_bytes = tx._get_signed_transaction_bytes(body_bytes)
+    assert tx._get_signed_transaction_bytes(body_bytes) is unsigned_bytes
+    assert tx._make_request().signedTransactionBytes == unsigned_bytes
+
+    key = PrivateKey.generate_ed25519()
+    tx.sign(key)
+    signed_bytes = tx._get_signed_transaction_bytes(body_bytes)
+
+    assert signed_bytes != unsigned_bytes
+    assert tx._get_signed_transaction_bytes(body_bytes) is signed_bytes
+    assert tx._make_request().signedTransactionBytes == signed_bytes
+
+    signed_transaction = transaction_contents_pb2.SignedTransaction.FromString(signed_bytes)
+    assert [sp.pubKeyPrefix for sp in signed_transaction.sigMap.sigPair] == [key.public_key().to_bytes_raw()]
+
+
+def test_sign_with_same_key_does_not_recompute_signatures():
+    """Test that signing again with a key that already signed every body skips the signing work."""
+    tx = TokenMintTransaction()
+    tx.set_transaction_id(TransactionId.generate(AccountId(0, 0, 1234)))
+    tx.set_node_account_id(AccountId(0, 0, 3))
+    tx.set_token_id(TokenId(0, 0, 1))
+    tx.set_amount(100)
+    tx.freeze()
+
+    key = PrivateKey.generate_ed25519()
+    with patch.object(PrivateKey, "sign", autospec=True, side_effect=PrivateKey.sign) as mock_sign:
+        tx.sign(key)
+        tx.sign(key)
+
+    assert mock_sign.call_count == len(tx._transaction_body_bytes)
+
+
+def test_retries_reuse_existing_signatures():
+    """Test that retrying a transaction after BUSY does not sign the bodies again."""
+    busy_response = transaction_response_pb2.TransactionResponse(nodeTransactionPrecheckCode=ResponseCode.BUSY)
+    ok_response = transaction_response_pb2.TransactionResponse(nodeTransactionPrecheckCode=ResponseCode.OK)
+
+    response_sequence = [[busy_response, busy_response, ok_response]]
+
+    with (
+        mock_hedera_servers(response_sequence) as client,
+        patch("hiero_sdk_python.executable.time.sleep"),
+        patch.object(PrivateKey, "sign", autospec=True, side_effect=PrivateKey.sign) as mock_sign,
+    ):
+        tx = AccountCreateTransaction().set_initial_balance(1).set_key_without_alias(PrivateKey.generate())
+        tx.execute(client, wait_for_receipt=False)
+
+        assert mock_sign.call_count == len(tx._transaction_body_bytes)
+
+
+def test_freeze_builds_body_once_for_all_nodes():
+    """Test that freezing for several nodes builds the body once and only changes the node per serialization."""
+    nodes = [AccountId(0, 0, 3), AccountId(0, 0, 4), AccountId(0, 0, 5)]
+    tx = TokenMintTransaction()
+    tx.set_transaction_id(TransactionId.generate(AccountId(0, 0, 1234)))
+    tx.set_node_account_ids(nodes)
+    tx.set_token_id(TokenId(0, 0, 1))
+    tx.set_amount(100)
+
+    with patch.object(
+        TokenMintTransaction,
+        "build_transaction_body",
+        autospec=True,
+        side_effect=TokenMintTransaction.build_transaction_body,
+    ) as mock_build:
+        tx.freeze()
+
+    assert mock_build.call_count == 1
+    assert list(tx._transaction_body_bytes) == nodes
+
+    for node in nodes:
+        expected = TokenMintTransaction()
+        expected.set_transaction_id(tx.transaction_id)
+        expected.set_node_account_id(node)
+        expected.set_token_id(TokenId(0, 0, 1))
+        expected.set_amount(100)
+        expected.freeze()
+
+        assert tx._transaction_body_bytes[node] == expected._transaction_body_bytes[node]
+
+
+def test_signed_transaction_bytes_dropped_on_refreeze():
+    """Test re-freezing a transaction drops serialized transactions built from the old bodies."""
+    tx = TokenMintTransaction()
+    tx.set_transaction_id(TransactionId.generate(AccountId(0, 0, 1234)))
+    tx.set_node_account_id(AccountId(0, 0, 3))
+    tx.set_token_id(TokenId(0, 0, 1))
+    tx.set_amount(100)
+    tx.freeze()
+    old_bytes = tx._make_request().signedTransactionBytes
+
+    tx._transaction_body_bytes.clear()
+    tx.set_transaction_id(TransactionId.generate(AccountId(0, 0, 1234)))
+    tx.freeze()
+
+    assert tx._signed_transaction_bytes == {}
+    assert tx._make_request().signedTransactionBytes != old_bytes
+    assert len(tx._signed_transaction_bytes) == 1
+
+
 def test_same_size_for_identical_transactions(transaction_id, account_id):
     """Test two identical transactions should have the same size."""
     key = PrivateKey.generate()
@@ -597,6 +597,83 @@ def test_invalid_amount_type_hbar_transfer(mock_account_ids):
         transfer_tx.add_hbar_transfer(account_id_1, 123.45)
 
 
+def test_add_hbar_transfers(mock_account_ids):
+    """Test adding several HBAR transfers at once, merging with existing transfers."""
+    account_id_sender, account_id_recipient, node_account_id, _, _ = mock_account_ids
+    transfer_tx = TransferTransaction()
+    transfer_tx.add_hbar_transfer(account_id_sender, -100)
+
+    transfer_tx.add_hbar_transfers(
+        {account_id_sender: Hbar.from_tinybars(-400), account_id_recipient: 300, node_account_id: 200}
+    )
+
+    amounts = {transfer.account_id: transfer.amount for transfer in transfer_tx.hbar_transfers}
+    assert amounts == {account_id_sender: -500, account_id_recipient: 300, node_account_id: 200}
+    assert [transfer.account_id for transfer in transfer_tx.hbar_transfers] == [
+        account_id_sender,
+        account_id_recipient,
+        node_account_id,
+    ]
+    assert all(transfer.is_approved is False for transfer in transfer_tx.hbar_transfers)
+
+
+def test_add_approved_hbar_transfers(mock_account_ids):
+    """Test adding several approved HBAR transfers at once."""
+    account_id_sender, account_id_recipient, _, _, _ = mock_account_ids
+    transfer_tx = TransferTransaction()
+
+    transfer_tx.add_approved_hbar_transfers({account_id_sender: Hbar(-1), account_id_recipient: Hbar(1)})
+
+    assert len(transfer_tx.hbar_transfers) == 2
+    assert transfer_tx.hbar_transfers[0].amount == -100_000_000
+    assert transfer_tx.hbar_transfers[1].amount == 100_000_000
+    assert all(transfer.is_approved is True for transfer in transfer_tx.hbar_transfers)
+
+    account_amounts = transfer_tx._build_proto_body().transfers.accountAmounts
+    assert [account_amount.is_approval for account_amount in account_amounts] == [True, True]
+
+
+def test_add_hbar_transfers_validation(mock_account_ids):
+    """Test that bulk HBAR transfers are validated like single transfers."""
+    account_id_sender, _, _, _, _ = mock_account_ids
+    transfer_tx = TransferTransaction()
+
+    with pytest.raises(TypeError, match="amount must be an int or Hbar instance"):
+        transfer_tx.add_hbar_transfers({account_id_sender: 1.5})
+
+    with pytest.raises(TypeError, match="account_id must be an AccountId instance"):
+        transfer_tx.add_hbar_transfers({"0.0.1": 1})
+
+
+def test_add_hbar_transfers_invalid_entry_leaves_transfers_unchanged(mock_account_ids):
+    """Test that an invalid entry anywhere in a bulk add applies none of the transfers."""
+    account_id_sender, account_id_recipient, node_account_id, _, _ = mock_account_ids
+    transfer_tx = TransferTransaction()
+    transfer_tx.add_hbar_transfer(account_id_sender, -100)
+
+    with pytest.raises(TypeError, match="amount must be an int or Hbar instance"):
+        transfer_tx.add_hbar_transfers({account_id_sender: -50, account_id_recipient: 150, node_account_id: 1.5})
+
+    assert [(transfer.account_id, transfer.amount) for transfer in transfer_tx.hbar_transfers] == [
+        (account_id_sender, -100)
+    ]
+
+
+def test_add_hbar_transfers_frozen_transaction(mock_account_ids, mock_client):
+    """Test that bulk HBAR transfers cannot be added to a frozen transaction."""
+    account_id_sender, account_id_recipient, _, _, _ = mock_account_ids
+    transfer_tx = TransferTransaction()
+    transfer_tx.freeze_with(mock_client)
+
+    with pytest.raises(Exception, match="Transaction is immutable; it has been frozen."):
+        transfer_tx.add_hbar_transfers({account_id_sender: -1, account_id_recipient: 1})
+
+    with pytest.raises(Exception, match="Transaction is immutable; it has been frozen."):
+        transfer_tx.add_approved_hbar_transfers({account_id_sender: -1, account_id_recipient: 1})
+
+    assert transfer_tx.hbar_transfers == []
+
+
 def test_token_transfer_with_expected_decimals_building(mock_account_ids):
     """Test token transfer with expected_decimals is properly built in transaction body."""
     account_id_1, account_id_2, node_account_id, token_id_1, _ = mock_account_ids